@@ -0,0 +1,204 @@
+"""Sorted appointment index for defaulter and missed-appointment queries.
+
+Scanning Appointments.csv for every follow-up question gets slow once a
+district has years of history. `AppointmentIndex` keeps:
+
+  - each patient's appointments sorted by date, for interval queries
+  - patients sorted by the date of their last completed visit, so "no
+    completed visit in the last N days" is a bisect plus the matching prefix
+  - outstanding (missed or still open) appointments sorted by date, so
+    "missed by more than X days" is also a prefix
+
+Dates stay ISO strings, as in missed_appointments_report, and compare as
+strings. `refresh()` reads only the rows appended to the CSV since the last
+call; a row whose appointment_id is already indexed replaces the old one, so
+status changes can be appended as new rows too.
+
+    index = AppointmentIndex.from_csv('HealthFlow-Mobile/schema/Appointments.csv')
+    index.no_completed_visit_within(90, as_of=date(2024, 3, 1))
+    index.missed_by_more_than(7, as_of=date(2024, 3, 1))
+"""
+import csv
+import io
+import os
+import sys
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+from missed_appointments_report import MISSED_STATUSES, OPEN_STATUSES, SCHEMA_DIR
+
+
+class AppointmentIndex:
+    """Incrementally updated index over the rows of Appointments.csv"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self._reset()
+
+    def _reset(self):
+        self._offset = 0
+        self._columns = None
+        self._appointments = {}                  # appointment_id -> (patient_id, date, status)
+        self._by_patient = defaultdict(list)     # patient_id -> sorted [(date, appointment_id)]
+        self._completed = defaultdict(list)      # patient_id -> sorted completed dates
+        self._last_completed = []                # sorted [(last completed date, patient_id)]
+        self._never_completed = set()
+        self._outstanding = []                   # sorted [(date, appointment_id)] missed or open
+
+    @classmethod
+    def from_csv(cls, path):
+        index = cls(path)
+        index.refresh()
+        return index
+
+    def __len__(self):
+        return len(self._appointments)
+
+    def refresh(self):
+        """Index the rows appended to the CSV since the last call; return how many"""
+        size = os.path.getsize(self.path)
+        if size < self._offset:
+            # The file was rewritten rather than appended to
+            self._reset()
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read()
+        # Leave a partially written last line for the next refresh
+        complete = data.rfind(b'\n') + 1
+        if not complete:
+            return 0
+        self._offset += complete
+        rows = csv.reader(io.StringIO(data[:complete].decode('utf-8'), newline=''))
+        if self._columns is None:
+            header = next(rows)
+            self._columns = [header.index(name) for name in
+                             ('appointment_id', 'patient_id', 'scheduled_date', 'status')]
+        batch = [[row[i] for i in self._columns] for row in rows if row]
+        if len(batch) > len(self._appointments):
+            # Sorting everything once beats len(batch) insertions into long lists
+            for appointment_id, patient_id, scheduled, status in batch:
+                self._appointments[appointment_id] = (patient_id, scheduled, status.lower())
+            self._rebuild()
+        else:
+            for row in batch:
+                self.add(*row)
+        return len(batch)
+
+    def _rebuild(self):
+        """Recreate the sorted structures from self._appointments"""
+        self._by_patient.clear()
+        self._completed.clear()
+        self._never_completed.clear()
+        self._outstanding = []
+        for appointment_id, (patient_id, scheduled, status) in self._appointments.items():
+            self._by_patient[patient_id].append((scheduled, appointment_id))
+            if status == 'completed':
+                self._completed[patient_id].append(scheduled)
+            elif status in MISSED_STATUSES or status in OPEN_STATUSES:
+                self._outstanding.append((scheduled, appointment_id))
+        for visits in self._by_patient.values():
+            visits.sort()
+        for completed in self._completed.values():
+            completed.sort()
+        self._outstanding.sort()
+        self._last_completed = sorted((completed[-1], patient_id) for patient_id, completed in self._completed.items())
+        self._never_completed.update(self._by_patient.keys() - self._completed.keys())
+
+    def add(self, appointment_id, patient_id, scheduled, status):
+        """Index one appointment, replacing any earlier row with the same id"""
+        if appointment_id in self._appointments:
+            self.remove(appointment_id)
+        status = status.lower()
+        self._appointments[appointment_id] = (patient_id, scheduled, status)
+        insort(self._by_patient[patient_id], (scheduled, appointment_id))
+        if status == 'completed':
+            completed = self._completed[patient_id]
+            previous = completed[-1] if completed else None
+            insort(completed, scheduled)
+            self._move_last_completed(patient_id, previous, completed[-1])
+        else:
+            if patient_id not in self._completed:
+                self._never_completed.add(patient_id)
+            if status in MISSED_STATUSES or status in OPEN_STATUSES:
+                insort(self._outstanding, (scheduled, appointment_id))
+
+    def remove(self, appointment_id):
+        patient_id, scheduled, status = self._appointments.pop(appointment_id)
+        _discard(self._by_patient[patient_id], (scheduled, appointment_id))
+        if status == 'completed':
+            completed = self._completed[patient_id]
+            previous = completed[-1]
+            _discard(completed, scheduled)
+            if not completed:
+                del self._completed[patient_id]
+            self._move_last_completed(patient_id, previous, completed[-1] if completed else None)
+        elif status in MISSED_STATUSES or status in OPEN_STATUSES:
+            _discard(self._outstanding, (scheduled, appointment_id))
+        if not self._by_patient[patient_id]:
+            del self._by_patient[patient_id]
+            self._never_completed.discard(patient_id)
+
+    def _move_last_completed(self, patient_id, previous, latest):
+        if previous == latest:
+            return
+        if previous is None:
+            self._never_completed.discard(patient_id)
+        else:
+            _discard(self._last_completed, (previous, patient_id))
+        if latest is None:
+            self._never_completed.add(patient_id)
+        else:
+            insort(self._last_completed, (latest, patient_id))
+
+    def history(self, patient_id, start='', end=None):
+        """(date, appointment_id, status) for a patient's appointments in [start, end)"""
+        visits = self._by_patient.get(patient_id, [])
+        lo = bisect_left(visits, (start,))
+        hi = bisect_left(visits, (end,)) if end is not None else len(visits)
+        return [(day, appointment_id, self._appointments[appointment_id][2])
+                for day, appointment_id in visits[lo:hi]]
+
+    def not_seen_since(self, cutoff, include_never=True):
+        """Patients whose last completed visit is before the ISO date `cutoff`"""
+        stale = [patient_id for _, patient_id in self._last_completed[:bisect_left(self._last_completed, (cutoff,))]]
+        if include_never:
+            stale.extend(sorted(self._never_completed))
+        return stale
+
+    def no_completed_visit_within(self, days, as_of=None, include_never=True):
+        as_of = as_of or date.today()
+        return self.not_seen_since((as_of - timedelta(days=days)).isoformat(), include_never)
+
+    def missed_by_more_than(self, days, as_of=None):
+        """(appointment_id, patient_id, date, status) of missed or still open
+        appointments scheduled more than `days` days before `as_of`"""
+        as_of = as_of or date.today()
+        cutoff = (as_of - timedelta(days=days)).isoformat()
+        overdue = self._outstanding[:bisect_right(self._outstanding, (cutoff,))]
+        return [(appointment_id, *self._appointments[appointment_id]) for _, appointment_id in overdue]
+
+
+def _discard(items, value):
+    i = bisect_left(items, value)
+    if i < len(items) and items[i] == value:
+        del items[i]
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    path = args[args.index('--csv') + 1] if '--csv' in args else os.path.join(SCHEMA_DIR, 'Appointments.csv')
+    as_of = datetime.strptime(args[args.index('--as-of') + 1], '%Y-%m-%d').date() if '--as-of' in args else date.today()
+    days = int(args[args.index('--days') + 1]) if '--days' in args else 30
+
+    start = time.perf_counter()
+    index = AppointmentIndex.from_csv(path)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    stale = index.no_completed_visit_within(days, as_of)
+    overdue = index.missed_by_more_than(days, as_of)
+    queried = time.perf_counter() - start
+    print(f'Patients with no completed visit in {days} days: {len(stale):,}')
+    print(f'Appointments missed by more than {days} days: {len(overdue):,}')
+    print(f'[OK] {len(index):,} appointments indexed in {built:.2f}s, queries took {queried * 1000:.1f}ms')
@@ -0,0 +1,68 @@
+import sys
+import time
+from copy import deepcopy
+
+from docx import Document
+from docx_anchors import find_anchor, insert_before
+
+ANCHOR = "Prospecting & Outreach Strategy"
+SIZES = [1000, 5000, 10000, 50000]
+INSERT_ROWS = 70
+# The legacy loop is quadratic; beyond this it takes minutes per size
+LEGACY_LIMIT = 10000
+
+
+def build_document(size):
+    """Synthetic document with the anchor heading halfway through"""
+    doc = Document()
+    # Style the filler paragraph once and copy it, so 50k paragraphs build quickly
+    filler = doc.add_paragraph('Filler paragraph', style='List Bullet')._p
+    for i in range(1, size):
+        if i == size // 2:
+            doc.add_heading(ANCHOR, 1)
+        else:
+            p = deepcopy(filler)
+            p.r_lst[0].text = f'Filler paragraph {i}'
+            doc.element.body.sectPr.addprevious(p)
+    return doc
+
+
+def rows():
+    return [(f'Inserted line {i}', 'List Bullet') for i in range(INSERT_ROWS)]
+
+
+def legacy_insert(doc):
+    """The original update_outreach_plan.py loop"""
+    insert_index = None
+    for i, para in enumerate(doc.paragraphs):
+        if ANCHOR in para.text:
+            insert_index = i
+            break
+    for text, style in rows():
+        p = doc.paragraphs[insert_index]._element
+        new_p = doc.add_paragraph(text, style=style)
+        p.addprevious(new_p._element)
+        doc.paragraphs[insert_index]._element.getparent().remove(new_p._element)
+        p.addprevious(new_p._element)
+
+
+def indexed_insert(doc):
+    insert_before(find_anchor(doc, ANCHOR), rows())
+
+
+def timed(func, size):
+    doc = build_document(size)
+    start = time.perf_counter()
+    func(doc)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    # Pass --legacy-all to also time the quadratic loop above LEGACY_LIMIT
+    legacy_limit = float('inf') if '--legacy-all' in sys.argv else LEGACY_LIMIT
+
+    print(f"{'Paragraphs':>10} {'Legacy (s)':>12} {'Indexed (s)':>12} {'Indexed us/para':>16}")
+    for size in SIZES:
+        legacy = timed(legacy_insert, size) if size <= legacy_limit else float('nan')
+        indexed = timed(indexed_insert, size)
+        print(f"{size:>10} {legacy:>12.4f} {indexed:>12.4f} {indexed / size * 1e6:>16.3f}")
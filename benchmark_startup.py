@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO = os.path.dirname(os.path.abspath(__file__))
+SCHEMA = os.path.join(REPO, 'HealthFlow-Mobile', 'schema')
+GENERATORS = [
+    ('create_action_plan.py', []),
+    ('create_client_plan.py', []),
+    ('create_western_uganda_plan.py', []),
+    ('missed_appointments_report.py', ['--week-start', '2024-01-08', '--schema', SCHEMA]),
+]
+REPEAT = 3
+
+# Runs one generator in a fresh interpreter and reports where the time went
+HARNESS = r'''
+import json, runpy, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {repo!r})
+import docx, lxml.etree
+import docx_template
+imported = time.perf_counter()
+if {legacy!r}:
+    # Document() + Normal style for every document, no style id cache
+    docx_template.new_document = lambda font=docx_template.DEFAULT_FONT: docx_template._prepare(font)
+make = docx_template.new_document
+first = []
+def timed_new_document(*args, **kwargs):
+    doc = make(*args, **kwargs)
+    first.append(first[0] if first else time.perf_counter())
+    return doc
+docx_template.new_document = timed_new_document
+sys.argv = [{script!r}, '--force', *{args!r}]
+try:
+    runpy.run_path({path!r}, run_name='__main__')
+except SystemExit:
+    pass
+done = time.perf_counter()
+print(json.dumps({{'imports': imported - started, 'first_document': (first[0] if first else done) - imported,
+                  'total': done - started}}), file=sys.stderr)
+'''
+
+
+def run(script, args, legacy, workdir):
+    code = HARNESS.format(repo=REPO, legacy=legacy, script=script, args=args, path=os.path.join(REPO, script))
+    env = dict(os.environ, IHM_BUILD_CACHE=os.path.join(workdir, '.build_cache'))
+    result = subprocess.run([sys.executable, '-c', code], cwd=workdir, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def best(script, args, legacy, workdir):
+    runs = [run(script, args, legacy, workdir) for _ in range(REPEAT)]
+    return {key: min(r[key] for r in runs) * 1000 for key in runs[0]}
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as workdir:
+        print(f"{'Generator':<32} {'Imports (ms)':>13} {'First doc (ms)':>15} {'Legacy total':>13} {'Cached total':>13}")
+        for script, args in GENERATORS:
+            legacy = best(script, args, True, workdir)
+            cached = best(script, args, False, workdir)
+            print(f"{script:<32} {cached['imports']:>13.1f} "
+                  f"{legacy['first_document']:>7.1f} -> {cached['first_document']:<5.1f} "
+                  f"{legacy['total']:>13.1f} {cached['total']:>13.1f}")
@@ -0,0 +1,261 @@
+"""Benchmark suite for the generators, the updaters and their building blocks.
+
+Every case runs in its own interpreter so peak RSS is measured per case
+(os.wait4 on the child). os.wait4 is POSIX only, so on Windows the cases are
+still timed but peak RSS is reported as nan. Synthetic stages run at each size
+in SIZES:
+
+    paragraphs        N styled paragraphs, then save
+    table_rows        one N-row table via table_from_rows, then save
+    prospects         N prospect sections (outreach_sections), then save
+    prospect_ranking  score N synthetic prospects and pick the top 10
+    update_splice     open a saved N-paragraph document, splice N paragraphs
+                      before an anchor (the update_* pattern), then save
+
+and the pipeline stage runs each build_documents.STEPS script once in a
+scratch directory. Results (wall time, peak RSS, output size) are written as
+JSON, by default to benchmark_results/<commit>.json; pass --compare with an
+older file to print the ratios.
+
+Usage: python benchmark_suite.py [--sizes 10,1000,100000] [--stages a,b]
+       [--full] [--out FILE] [--compare OLD.json]
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+REPO = os.path.dirname(os.path.abspath(__file__))
+SIZES = [10, 1000, 100000]
+STAGES = ['paragraphs', 'table_rows', 'prospects', 'prospect_ranking', 'update_splice', 'pipeline']
+# Each prospect section is ~20 blocks and appending one rescans the body for
+# its sectPr, so 10k+ sections take many minutes; --full runs them anyway
+SIZE_LIMITS = {'prospects': 1000}
+# ru_maxrss is in KiB on Linux but in bytes on macOS
+RSS_PER_MB = 1024 * 1024 if sys.platform == 'darwin' else 1024
+
+
+def _synthetic_prospects(size):
+    """`size` variations on the western plan's prospects"""
+    from generate_outreach_packs import load_prospects
+
+    seeds = load_prospects()
+    prospects = []
+    for i in range(size):
+        prospect = dict(seeds[i % len(seeds)])
+        prospect['name'] = f"{prospect['name']} #{i}"
+        prospect['patients'] = 100 + (i * 7919) % 5000
+        prospects.append(prospect)
+    return prospects
+
+
+def case_paragraphs(size, workdir):
+    from docx_template import new_document
+
+    doc = new_document()
+    for i in range(size):
+        if i % 50 == 0:
+            doc.add_heading(f'Section {i // 50}', 1)
+        doc.add_paragraph(f'Paragraph {i}: follow up with patient cohort {i % 97}',
+                          style='List Bullet' if i % 2 else None)
+    return _save(doc, workdir, 'paragraphs.docx')
+
+
+def case_table_rows(size, workdir):
+    from docx_tables import table_from_rows
+    from docx_template import new_document
+
+    doc = new_document()
+    rows = [('Patient', 'Facility', 'Status', 'Next Visit')]
+    rows += [(f'patient_{i:07d}', f'facility_{i % 40:03d}', 'active', '2024-02-01') for i in range(size)]
+    table_from_rows(doc, rows, style='Light Grid Accent 1')
+    return _save(doc, workdir, 'table_rows.docx')
+
+
+def case_prospects(size, workdir):
+    from docx_template import new_document
+    from outreach_sections import add_prospect_section
+    from prospect_scoring import rank_prospects
+
+    doc = new_document()
+    for prospect in rank_prospects(_synthetic_prospects(size)):
+        add_prospect_section(doc, prospect)
+    return _save(doc, workdir, 'prospects.docx')
+
+
+def case_prospect_ranking(size, workdir):
+    from prospect_scoring import rank_prospects
+
+    rank_prospects(_synthetic_prospects(size), top=10)
+    return None
+
+
+def case_update_splice(size, workdir):
+    from docx import Document
+    from docx_anchors import find_anchor
+    from docx_splice import build_fragment, splice_before
+
+    path = os.path.join(workdir, 'update_source.docx')
+    if not os.path.exists(path):
+        case_paragraphs(size, workdir)
+        shutil.move(os.path.join(workdir, 'paragraphs.docx'), path)
+        doc = Document(path)
+        doc.add_heading('Prospecting & Outreach Strategy', 1)
+        doc.save(path)
+    doc = Document(path)
+    anchor = find_anchor(doc, 'Prospecting & Outreach Strategy')
+    blocks = [(f'Inserted paragraph {i}', 'List Bullet') for i in range(size)]
+    splice_before(anchor, build_fragment(doc, blocks))
+    return _save(doc, workdir, 'updated.docx')
+
+
+def _save(doc, workdir, name):
+    from build_cache import save_document
+
+    path = os.path.join(workdir, name)
+    save_document(doc, path)
+    return path
+
+
+def _run_case(stage, size, workdir):
+    """Child process: time one case and print its result as JSON"""
+    import build_cache, docx_anchors, docx_splice, docx_tables, generate_outreach_packs  # noqa: F401
+    import outreach_sections, prospect_scoring  # noqa: F401
+    from docx_template import base_document
+
+    # Time the stage itself, not imports or the one-off template parse
+    base_document()
+    case = globals()[f'case_{stage}']
+    if stage == 'update_splice':
+        case(size, workdir)  # build the input document outside the timed run
+        os.remove(os.path.join(workdir, 'updated.docx'))
+    start = time.perf_counter()
+    output = case(size, workdir)
+    wall = time.perf_counter() - start
+    print(json.dumps({'wall_s': wall, 'output_bytes': os.path.getsize(output) if output else None}))
+
+
+def _measure(command, cwd, env=None):
+    """Run `command`, returning (stdout, wall seconds, peak RSS in MB or nan)"""
+    start = time.perf_counter()
+    child = subprocess.Popen(command, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if not hasattr(os, 'wait4'):
+        stdout, stderr = child.communicate()
+        if child.returncode:
+            raise RuntimeError(f'{command} failed:\n{stderr.decode(errors="replace")}')
+        return stdout.decode(), time.perf_counter() - start, float('nan')
+    # Drain stderr on a thread so a chatty child never blocks on a full pipe;
+    # communicate() would reap the child before wait4 can read its usage
+    stderr = []
+    drain = threading.Thread(target=lambda: stderr.append(child.stderr.read()))
+    drain.start()
+    stdout = child.stdout.read()
+    drain.join()
+    stderr = stderr[0]
+    _, status, usage = os.wait4(child.pid, 0)
+    wall = time.perf_counter() - start
+    child.returncode = os.waitstatus_to_exitcode(status)
+    if child.returncode:
+        raise RuntimeError(f'{command} failed:\n{stderr.decode(errors="replace")}')
+    return stdout.decode(), wall, usage.ru_maxrss / RSS_PER_MB
+
+
+def synthetic_case(stage, size):
+    with tempfile.TemporaryDirectory() as workdir:
+        stdout, _, rss = _measure([sys.executable, os.path.abspath(__file__), '--case', stage, str(size), workdir], REPO)
+    result = json.loads(stdout.strip().splitlines()[-1])
+    return {'stage': stage, 'size': size, **result, 'peak_rss_mb': round(rss, 1)}
+
+
+def pipeline_cases():
+    from build_documents import OUTREACH_TEMP, STEPS
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        shutil.copy(os.path.join(REPO, OUTREACH_TEMP), workdir)
+        env = dict(os.environ, IHM_BUILD_CACHE=os.path.join(workdir, '.build_cache'))
+        for step in STEPS:
+            before = {name: os.path.getmtime(os.path.join(workdir, name)) for name in os.listdir(workdir)}
+            _, wall, rss = _measure([sys.executable, os.path.join(REPO, step['script']), '--force'], workdir, env)
+            written = [name for name in step['writes'] if os.path.exists(os.path.join(workdir, name))
+                       and before.get(name) != os.path.getmtime(os.path.join(workdir, name))]
+            results.append({
+                'stage': f"pipeline:{step['script']}", 'size': 1, 'wall_s': wall, 'peak_rss_mb': round(rss, 1),
+                'output_bytes': sum(os.path.getsize(os.path.join(workdir, name)) for name in written) or None,
+            })
+    return results
+
+
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(current, previous):
+    old = {(r['stage'], r['size']): r for r in previous['results']}
+    print(f"\nCompared with {previous.get('commit', '?')}:")
+    print(f"{'Stage':<40} {'Size':>8} {'Wall':>10} {'Peak RSS':>10}")
+    for r in current['results']:
+        before = old.get((r['stage'], r['size']))
+        if not before or 'wall_s' not in r or 'wall_s' not in before:
+            continue
+        print(f"{r['stage']:<40} {r['size']:>8} {r['wall_s'] / before['wall_s']:>9.2f}x "
+              f"{r['peak_rss_mb'] / before['peak_rss_mb']:>9.2f}x")
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if args and args[0] == '--case':
+        sys.path.insert(0, REPO)
+        _run_case(args[1], int(args[2]), args[3])
+        sys.exit(0)
+
+    sizes = [int(s) for s in args[args.index('--sizes') + 1].split(',')] if '--sizes' in args else SIZES
+    stages = args[args.index('--stages') + 1].split(',') if '--stages' in args else STAGES
+    limits = {} if '--full' in args else SIZE_LIMITS
+    commit = _commit()
+    out = args[args.index('--out') + 1] if '--out' in args else os.path.join('benchmark_results', f'{commit}.json')
+
+    import docx
+    report = {
+        'commit': commit,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'python_docx': docx.__version__,
+        'results': [],
+    }
+    print(f"{'Stage':<40} {'Size':>8} {'Wall (s)':>10} {'Peak RSS (MB)':>14} {'Output (KB)':>12}")
+    for stage in stages:
+        if stage == 'pipeline':
+            cases = pipeline_cases()
+        else:
+            cases = []
+            for size in sizes:
+                if size > limits.get(stage, size):
+                    cases.append({'stage': stage, 'size': size, 'skipped': 'above SIZE_LIMITS, pass --full'})
+                else:
+                    cases.append(synthetic_case(stage, size))
+        for r in cases:
+            report['results'].append(r)
+            if 'skipped' in r:
+                print(f"{r['stage']:<40} {r['size']:>8} {'skipped':>10}")
+                continue
+            output = f"{r['output_bytes'] / 1024:.0f}" if r['output_bytes'] else '-'
+            print(f"{r['stage']:<40} {r['size']:>8} {r['wall_s']:>10.3f} {r['peak_rss_mb']:>14.1f} {output:>12}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f'[OK] Results written to {out}')
+
+    if '--compare' in args:
+        with open(args[args.index('--compare') + 1], encoding='utf-8') as f:
+            compare(report, json.load(f))
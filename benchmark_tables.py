@@ -0,0 +1,47 @@
+import sys
+import time
+
+from docx import Document
+from docx_tables import table_from_rows
+
+SIZES = [100, 1000, 10000, 100000]
+COLS = 4
+# Filling cells through table.rows[i].cells is quadratic; 10k rows already takes minutes
+LEGACY_LIMIT = 1000
+
+
+def rows(size):
+    return [(f'Month {i}', f'{i % 45}', f'UGX {i * 2956300:,}', f'UGX {i * 7400000:,}') for i in range(size)]
+
+
+def legacy_table(doc, data):
+    """The add_table + cells[j].text pattern the generators used"""
+    table = doc.add_table(rows=len(data), cols=COLS)
+    table.style = 'Light Grid Accent 1'
+    for i, row_data in enumerate(data):
+        cells = table.rows[i].cells
+        for j, text in enumerate(row_data):
+            cells[j].text = text
+
+
+def bulk_table(doc, data):
+    table_from_rows(doc, data, style='Light Grid Accent 1')
+
+
+def timed(func, size):
+    doc = Document()
+    data = rows(size)
+    start = time.perf_counter()
+    func(doc, data)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    # Pass --legacy-all to also time the legacy pattern above LEGACY_LIMIT
+    legacy_limit = float('inf') if '--legacy-all' in sys.argv else LEGACY_LIMIT
+
+    print(f"{'Rows':>8} {'Legacy (s)':>12} {'table_from_rows (s)':>20} {'Speedup':>8}")
+    for size in SIZES:
+        legacy = timed(legacy_table, size) if size <= legacy_limit else float('nan')
+        bulk = timed(bulk_table, size)
+        print(f"{size:>8} {legacy:>12.4f} {bulk:>20.4f} {legacy / bulk:>8.1f}")
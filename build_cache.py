@@ -0,0 +1,179 @@
+"""Deterministic builds and a content-addressed output cache for the generators.
+
+Set IHM_BUILD_DATE=YYYY-MM-DD to pin the "Prepared:" date, the document core
+properties and the zip member timestamps, so the same inputs always produce
+the same bytes. Each generator derives a cache key from its own source and
+that of every repo module it imports, its GENERATOR_VERSION, the build date
+and the python-docx version; when the key matches the last recorded build
+the generator skips the rebuild entirely.
+Pass --force to rebuild anyway.
+"""
+import ast
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import zipfile
+from datetime import datetime
+
+import docx
+
+CACHE_DIR = os.environ.get('IHM_BUILD_CACHE', '.build_cache')
+MANIFEST = os.path.join(CACHE_DIR, 'manifest.json')
+OBJECTS = os.path.join(CACHE_DIR, 'objects')
+
+
+def build_date():
+    """The pinned IHM_BUILD_DATE if set, otherwise now"""
+    pinned = os.environ.get('IHM_BUILD_DATE')
+    if pinned:
+        return datetime.strptime(pinned, '%Y-%m-%d')
+    return datetime.now()
+
+
+def is_deterministic():
+    return bool(os.environ.get('IHM_BUILD_DATE'))
+
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def local_imports(source_path):
+    """Sorted paths of the repo modules `source_path` imports, directly or through each other"""
+    here = os.path.dirname(os.path.abspath(source_path))
+    found = set()
+    pending = [os.path.abspath(source_path)]
+    while pending:
+        with open(pending.pop(), 'rb') as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                path = os.path.join(here, name.split('.')[0] + '.py')
+                if path not in found and os.path.exists(path):
+                    found.add(path)
+                    pending.append(path)
+    found.discard(os.path.abspath(source_path))
+    return sorted(found)
+
+
+def cache_key(source_path, version, *extra, depends_on=()):
+    """Hash of everything that determines a generator's output
+
+    Every repo module the generator imports (see local_imports) is hashed
+    along with it. `depends_on` adds data files, relative to the generator,
+    that also shape the document.
+    """
+    digest = hashlib.sha256()
+    digest.update(f'{version}\0{docx.__version__}\0'.encode())
+    digest.update(build_date().strftime('%Y-%m-%d').encode())
+    here = os.path.dirname(os.path.abspath(source_path))
+    data = [os.path.join(here, p) for p in depends_on]
+    for path in [source_path, *local_imports(source_path), *data]:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    for part in extra:
+        digest.update(b'\0')
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+    return digest.hexdigest()
+
+
+def _load_manifest():
+    if not os.path.exists(MANIFEST):
+        return {}
+    with open(MANIFEST, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _save_manifest(manifest):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = MANIFEST + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, MANIFEST)
+
+
+def up_to_date(output_path, key):
+    """True if `output_path` already holds the build for `key`
+
+    A missing or edited output is restored from the object store when the
+    matching build is still cached there.
+    """
+    if '--force' in sys.argv:
+        return False
+    entry = _load_manifest().get(os.path.abspath(output_path))
+    if entry is None or entry['key'] != key:
+        return False
+    if os.path.exists(output_path) and _sha256_file(output_path) == entry['sha256']:
+        return True
+    cached = os.path.join(OBJECTS, entry['sha256'] + '.docx')
+    if os.path.exists(cached):
+        shutil.copyfile(cached, output_path)
+        return True
+    return False
+
+
+def _normalized_package(doc):
+    """Serialize `doc` with pinned core properties and zip timestamps"""
+    pinned = build_date()
+    doc.core_properties.created = pinned
+    doc.core_properties.modified = pinned
+    doc.core_properties.revision = 1
+
+    raw = io.BytesIO()
+    doc.save(raw)
+    raw.seek(0)
+    out = io.BytesIO()
+    timestamp = (max(pinned.year, 1980), pinned.month, pinned.day, 0, 0, 0)
+    with zipfile.ZipFile(raw) as src, zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            info = zipfile.ZipInfo(item.filename, date_time=timestamp)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            dst.writestr(info, src.read(item.filename))
+    return out.getvalue()
+
+
+def document_bytes(doc):
+    """The .docx bytes of `doc`, normalized when a build date is pinned"""
+    if is_deterministic():
+        return _normalized_package(doc)
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+
+def save_document(doc, output_path):
+    """Save `doc`, normalized when a build date is pinned"""
+    if is_deterministic():
+        with open(output_path, 'wb') as f:
+            f.write(_normalized_package(doc))
+    else:
+        doc.save(output_path)
+
+
+def save_output(doc, output_path, key):
+    """Save `doc` and record it in the cache under `key`"""
+    save_document(doc, output_path)
+
+    sha256 = _sha256_file(output_path)
+    os.makedirs(OBJECTS, exist_ok=True)
+    cached = os.path.join(OBJECTS, sha256 + '.docx')
+    if not os.path.exists(cached):
+        shutil.copyfile(output_path, cached)
+
+    manifest = _load_manifest()
+    manifest[os.path.abspath(output_path)] = {'key': key, 'sha256': sha256}
+    _save_manifest(manifest)
@@ -0,0 +1,150 @@
+"""Run the document pipeline as a dependency graph instead of by hand.
+
+Each step declares the .docx files it reads and writes. A step depends on the
+most recent earlier step that writes a file it reads or writes, and a step
+that writes a file also waits for the earlier steps that read it. The
+action-plan chain and the outreach chain run side by side in a process pool
+while steps touching the same file keep their order. Each step gets a new
+worker process, as if it were run by hand.
+
+Usage: python build_documents.py [--jobs N] [--dry-run] [--force]
+(--force is passed through to the create_*.py build cache)
+"""
+import os
+import runpy
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+ACTION_PLAN = '90-Day Action Plan - AI HIV Automation (Western Uganda).docx'
+OUTREACH_PLAN = 'Client Outreach Plan - Western Uganda (10 First Customers).docx'
+OUTREACH_TEMP = 'Client_Outreach_Plan_Updated_TEMP.docx'
+OUTREACH_UPDATED = 'Client Outreach Plan - Western Uganda (10 First Customers)_UPDATED.docx'
+OUTREACH_BACKUP = 'Client Outreach Plan - Western Uganda (10 First Customers)_ORIGINAL_BACKUP.docx'
+
+# In the order the scripts used to be run by hand
+STEPS = [
+    {'script': 'create_action_plan.py', 'reads': [], 'writes': [ACTION_PLAN]},
+    {'script': 'create_western_uganda_plan.py', 'reads': [], 'writes': [OUTREACH_PLAN]},
+    {'script': 'update_plan_v2.py', 'reads': [OUTREACH_TEMP], 'writes': [OUTREACH_UPDATED]},
+    {'script': 'update_heading.py', 'reads': [OUTREACH_PLAN], 'writes': [OUTREACH_PLAN]},
+    {'script': 'finalize_update.py', 'reads': [OUTREACH_UPDATED, OUTREACH_PLAN], 'writes': [OUTREACH_PLAN, OUTREACH_BACKUP]},
+    {'script': 'update_action_plan.py', 'reads': [ACTION_PLAN], 'writes': [ACTION_PLAN]},
+]
+
+
+def dependencies(steps):
+    """Map each script to the scripts it has to wait for"""
+    last_writer = {}
+    readers = {}  # file -> steps that read it since its last write
+    deps = {}
+    for step in steps:
+        script = step['script']
+        before = {last_writer[f] for f in set(step['reads']) | set(step['writes']) if f in last_writer}
+        # A write must also wait for everyone still reading the old contents
+        for f in step['writes']:
+            before |= readers.get(f, set())
+        before.discard(script)
+        deps[script] = sorted(before)
+        for f in step['reads']:
+            readers.setdefault(f, set()).add(script)
+        for f in step['writes']:
+            last_writer[f] = script
+            readers[f] = set()
+    return deps
+
+
+def run_step(script):
+    """Run one pipeline script in a fresh worker, returning its start and end time"""
+    start = time.time()
+    try:
+        runpy.run_path(script, run_name='__main__')
+    except SystemExit as exit:
+        if exit.code not in (None, 0):
+            raise RuntimeError(f'{script} exited with status {exit.code}')
+    return start, time.time()
+
+
+def critical_path(deps, durations):
+    """Longest chain of dependent steps by measured duration"""
+    finish = {}
+    previous = {}
+    for script in deps:  # steps are listed in dependency order
+        before = max(deps[script], key=lambda d: finish[d], default=None)
+        finish[script] = durations[script] + (finish[before] if before else 0.0)
+        previous[script] = before
+    end = max(finish, key=finish.get)
+    path = []
+    while end:
+        path.append(end)
+        end = previous[end]
+    return list(reversed(path)), max(finish.values())
+
+
+def build(steps, jobs=None):
+    deps = dependencies(steps)
+    pending = {script: set(before) for script, before in deps.items()}
+    times = {}
+    failed = set()
+    started = time.time()
+
+    # One step per worker: the scripts keep module-level state (trace spans,
+    # spec memos, the imported generator itself) that must not leak into the next
+    with ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1) as pool:
+        running = {}
+        while pending or running:
+            for script in [s for s, before in pending.items() if not before]:
+                del pending[script]
+                running[pool.submit(run_step, script)] = script
+
+            if not running:
+                # Everything left waits on a failed step
+                for script in pending:
+                    print(f'[SKIPPED] {script}')
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                script = running.pop(future)
+                try:
+                    times[script] = future.result()
+                except Exception as e:
+                    print(f'[FAILED] {script}: {e}')
+                    failed.add(script)
+                    continue
+                # Steps after a failure keep it as a dependency and never become ready
+                for before in pending.values():
+                    before.discard(script)
+
+    wall = time.time() - started
+    return deps, times, failed, wall
+
+
+def report(deps, times, wall):
+    durations = {s: end - start for s, (start, end) in times.items()}
+    print()
+    print(f"{'Step':<32} {'Start (s)':>10} {'Time (s)':>10}")
+    origin = min(start for start, _ in times.values())
+    for script in deps:
+        if script in times:
+            print(f'{script:<32} {times[script][0] - origin:>10.2f} {durations[script]:>10.2f}')
+    if len(durations) == len(deps):
+        path, length = critical_path(deps, durations)
+        print(f"\nCritical path ({length:.2f}s): {' -> '.join(path)}")
+    print(f'Serial time: {sum(durations.values()):.2f}s | Wall time: {wall:.2f}s')
+
+
+if __name__ == '__main__':
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    jobs = int(sys.argv[sys.argv.index('--jobs') + 1]) if '--jobs' in sys.argv else None
+    deps = dependencies(STEPS)
+
+    if '--dry-run' in sys.argv:
+        for script, before in deps.items():
+            print(f"{script:<32} after: {', '.join(before) or '-'}")
+        sys.exit(0)
+
+    deps, times, failed, wall = build(STEPS, jobs)
+    if times:
+        report(deps, times, wall)
+    sys.exit(1 if failed or len(times) < len(deps) else 0)
@@ -1,13 +1,36 @@
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from datetime import datetime
+import os
+import sys
 
-doc = Document()
-# Set default font and spacing
-style = doc.styles['Normal']
-style.font.name = 'Calibri'
-style.font.size = Pt(11)
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+import docx_trace as trace
+from build_cache import build_date, cache_key, save_output, up_to_date
+from doc_render import DocxRenderer, HtmlRenderer, MarkdownRenderer, partial_paths, render, sync_pages, write_partial
+from doc_spec import compile_spec
+from docx_tables import table_from_rows
+from docx_template import new_document
+from financial_model import FinancialModel, break_even_share, count_range, scenario_rows, ugx, ugx_range
+
+OUTPUT = r'90-Day Action Plan - AI HIV Automation (Western Uganda).docx'
+GENERATOR_VERSION = '2'
+SITE_PARTIALS = ['modules', 'pricing']
+
+# Skip the rebuild when nothing that feeds this document (or the site partials) has changed
+build_key = cache_key(__file__, GENERATOR_VERSION, depends_on=['specs/platform_modules.json'])
+partials = [path for name in SITE_PARTIALS for path in partial_paths(name)]
+if up_to_date(OUTPUT, build_key) and all(os.path.exists(path) for path in partials):
+    # The pages may still have been edited by hand since the partials were written
+    for path in [page for name in SITE_PARTIALS for page in sync_pages(name)]:
+        print(f'[OK] Updated {os.path.relpath(path)}')
+    print('[OK] 90-Day Action Plan is up to date')
+    sys.exit(0)
+
+# Calibri 11pt base document, cloned from the prepared template
+doc = new_document()
+
+# All financial figures come from the model so the sections agree
+model = FinancialModel()
+scenarios = model.simulate()
+goal_low, goal_high = 15, 20
 
 def justify_paragraph(paragraph):
     """Apply justified alignment and line spacing"""
@@ -15,12 +38,19 @@ def justify_paragraph(paragraph):
     paragraph.paragraph_format.line_spacing = 1.15
     return paragraph
 
+def publish(name, ops):
+    """Append `ops` to the document and write the same content as site HTML and Markdown"""
+    _, html, markdown = render(ops, DocxRenderer(doc), HtmlRenderer(), MarkdownRenderer())
+    for path in write_partial(name, html, markdown):
+        print(f'[OK] Updated {os.path.relpath(path)}')
+
 # Title
+trace.section('Title & Contents', doc)
 title = doc.add_heading('AI + n8n Automation for HIV Patient Management', 0)
 title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 subtitle = doc.add_paragraph('90-Day Action Plan & Strategic Roadmap')
 subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-date = doc.add_paragraph(f'Prepared: {datetime.now().strftime("%B %d, %Y")}')
+date = doc.add_paragraph(f'Prepared: {build_date().strftime("%B %d, %Y")}')
 date.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
 doc.add_paragraph()
@@ -39,6 +69,7 @@ for item in toc_items:
 doc.add_page_break()
 
 # SECTION 1: EXECUTIVE SUMMARY
+trace.section('Executive Summary', doc)
 doc.add_heading('1. EXECUTIVE SUMMARY', 1)
 
 doc.add_heading('Business Overview', 2)
@@ -67,54 +98,30 @@ value_props = [
 for prop in value_props:
     doc.add_paragraph(prop, style='List Bullet')
 
-doc.add_heading('Integrated Platform Modules', 2)
-doc.add_paragraph()
-doc.add_paragraph('Core HIV Management Module', style='List Bullet').bold = True
-p = doc.add_paragraph(
-    'Patient cohort tracking, ART adherence monitoring, missed appointment flagging, viral load tracking, treatment interruption alerts'
-)
-p.paragraph_format.level = 1
-
-doc.add_paragraph('Chronic Disease Management Module', style='List Bullet').bold = True
-p = doc.add_paragraph(
-    'Diabetes and hypertension patient tracking, medication monitoring, vital signs integration, comorbidity risk alerts, clinic visit scheduling'
-)
-p.paragraph_format.level = 1
-
-doc.add_paragraph('Maternal Health Tracking Module', style='List Bullet').bold = True
-p = doc.add_paragraph(
-    'PMTCT (Prevention of Mother-to-Child Transmission) monitoring, antenatal care scheduling, postnatal follow-up tracking, infant prophylaxis adherence, care coordinator alerts'
-)
-p.paragraph_format.level = 1
-
-doc.add_paragraph('Medication Adherence System', style='List Bullet').bold = True
-p = doc.add_paragraph(
-    'AI-powered medication reminders via WhatsApp, adherence pattern analysis, early warning for non-adherence, family/caregiver engagement, personalized intervention recommendations'
-)
-p.paragraph_format.level = 1
-
-doc.add_paragraph('Clinic Appointment Management', style='List Bullet').bold = True
-p = doc.add_paragraph(
-    'Automated appointment scheduling, multi-day reminder system, no-show prediction, appointment rescheduling workflow, clinic resource optimization'
-)
-p.paragraph_format.level = 1
-
-doc.add_paragraph()
+# Shared with the marketing site (pages/partials), rendered in the same pass
+publish('modules', compile_spec('platform_modules'))
 
 doc.add_heading('Target Revenue Goal - First 90 Days', 2)
 revenue_goals = doc.add_paragraph()
 revenue_goals.add_run('Primary Goal: ').bold = True
-revenue_goals.add_run('15-20 paying customers at UGX 2,956,300/month (Silver tier) = UGX 44,344,500 - UGX 59,126,000 monthly recurring revenue\n')
+revenue_goals.add_run(
+    f'{count_range(goal_low, goal_high)} paying customers at {ugx(model.price)}/month (Silver tier) = '
+    f'{ugx(goal_low * model.price)} - {ugx(goal_high * model.price)} monthly recurring revenue\n'
+)
 revenue_goals.add_run('Profitability Target: ').bold = True
-revenue_goals.add_run('16+ customers (break-even at UGX 18,500,000/month fixed costs)\n')
+revenue_goals.add_run(f'{model.break_even_customers}+ customers (break-even at {ugx(model.fixed_costs)}/month fixed costs)\n')
 revenue_goals.add_run('Setup Fee Revenue: ').bold = True
-revenue_goals.add_run('UGX 7,400,000-18,500,000 per customer (5-10 customers = UGX 37,000,000-185,000,000)\n')
+fee_low, fee_high = model.setup_fee_range
+revenue_goals.add_run(
+    f'{ugx_range(fee_low, fee_high)} per customer (5-10 customers = {ugx_range(5 * fee_low, 10 * fee_high)})\n'
+)
 revenue_goals.add_run('Module Upsell Potential: ').bold = True
 revenue_goals.add_run('Additional UGX 370,000-740,000/month per facility for each integrated module (Maternal Health, Chronic Disease, etc.)')
 
 doc.add_page_break()
 
 # SECTION 2: MARKET VALIDATION
+trace.section('Market Validation', doc)
 doc.add_heading('2. MARKET VALIDATION', 1)
 
 doc.add_heading('Evidence That Target Customers Exist', 2)
@@ -212,6 +219,7 @@ total_addressable.add_run('150-250 facilities × UGX 2,956,300/month = UGX 443,4
 doc.add_page_break()
 
 # SECTION 3: 30-60-90 DAY ACTION PLAN
+trace.section('30-60-90 Day Action Plan', doc)
 doc.add_heading('3. 30-60-90 DAY ACTION PLAN', 1)
 
 doc.add_heading('Days 1-30: Foundation & Initial Outreach', 2)
@@ -332,9 +340,9 @@ doc.add_paragraph('Develop customer success documentation and self-serve onboard
 doc.add_paragraph('Analyze MoM growth rate and plan next 90-day expansion', style='List Bullet 2')
 
 doc.add_heading('Expected Outcome - Days 61-90', 3)
-doc.add_paragraph('✓ 15-20 paying customers at UGX 2,956,300/month Silver tier')
-doc.add_paragraph('✓ Monthly Recurring Revenue (MRR): UGX 44,344,500-UGX 59,126,000')
-doc.add_paragraph('✓ Profitability achieved (break-even at 16 customers)')
+doc.add_paragraph(f'✓ {count_range(goal_low, goal_high)} paying customers at {ugx(model.price)}/month Silver tier')
+doc.add_paragraph(f'✓ Monthly Recurring Revenue (MRR): {ugx(goal_low * model.price)}-{ugx(goal_high * model.price)}')
+doc.add_paragraph(f'✓ Profitability achieved (break-even at {model.break_even_customers} customers)')
 doc.add_paragraph('✓ 2-3 published case studies demonstrating customer success')
 doc.add_paragraph('✓ Clear growth momentum and expansion roadmap')
 doc.add_paragraph('✓ 30-50+ leads in pipeline for next 90 days')
@@ -342,105 +350,73 @@ doc.add_paragraph('✓ 30-50+ leads in pipeline for next 90 days')
 doc.add_page_break()
 
 # SECTION 4: FINANCIAL PROJECTIONS
+trace.section('Financial Projections', doc)
 doc.add_heading('4. FINANCIAL PROJECTIONS', 1)
 
-doc.add_heading('Pricing Structure', 2)
-doc.add_paragraph()
-
-pricing_table = doc.add_table(rows=5, cols=4)
-pricing_table.style = 'Light Grid Accent 1'
-
-# Header row
-hdr_cells = pricing_table.rows[0].cells
-hdr_cells[0].text = 'Tier'
-hdr_cells[1].text = 'Monthly Price'
-hdr_cells[2].text = 'Target Customer'
-hdr_cells[3].text = 'Annual Value'
-
-# Data rows (converted to UGX at 1 USD = 3,700 UGX)
-tiers_data = [
-    ('Bronze', 'UGX 1,476,300', 'Small clinics, NGOs', 'UGX 17,715,600'),
-    ('Silver', 'UGX 2,956,300', 'Hospitals, district programs', 'UGX 35,475,600'),
-    ('Gold', 'UGX 5,546,300', 'Multi-facility, regional programs', 'UGX 66,555,600'),
-]
-for i, (tier, price, customer, annual) in enumerate(tiers_data, start=1):
-    row_cells = pricing_table.rows[i].cells
-    row_cells[0].text = tier
-    row_cells[1].text = price
-    row_cells[2].text = customer
-    row_cells[3].text = annual
+# Prices converted to UGX at 1 USD = 3,700 UGX
+publish('pricing', (
+    ('p', 'Pricing Structure', 'Heading 2'),
+    ('p', '', None),
+    ('table', tuple(model.pricing_rows()), 'Light Grid Accent 1'),
+    ('p', '', None),
+    ('runs', (('One-Time Setup Fee: ', True),
+              (f'{ugx(model.setup_fee)} per customer (covers initial workflow customization, data migration, training)', None)),
+     None),
+))
 
-doc.add_paragraph()
-setup_fee = doc.add_paragraph()
-setup_fee.add_run('One-Time Setup Fee: ').bold = True
-setup_fee.add_run('UGX 7,400,000 per customer (covers initial workflow customization, data migration, training)')
-
-doc.add_heading('Cost Breakdown - Silver Tier (UGX 2,956,300/month)', 2)
-
-cost_table = doc.add_table(rows=7, cols=2)
-cost_table.style = 'Light Grid Accent 1'
-
-cost_rows = [
-    ('Cost Category', 'Monthly Cost'),
-    ('n8n Cloud Workspace (advanced)', 'UGX 185,000'),
-    ('OpenAI API usage (1000+ messages/month)', 'UGX 92,500'),
-    ('Google Workspace/Sheets (shared)', 'UGX 37,000'),
-    ('WhatsApp Business API (per customer)', 'UGX 148,000'),
-    ('Support & Onboarding (30 min/month)', 'UGX 555,000'),
-    ('COGS Total', 'UGX 1,017,500'),
-]
+doc.add_heading(f'Cost Breakdown - Silver Tier ({ugx(model.price)}/month)', 2)
 
-for i, (category, cost) in enumerate(cost_rows):
-    cells = cost_table.rows[i].cells
-    cells[0].text = category
-    cells[1].text = cost
+cost_table = table_from_rows(doc, model.cost_rows(), style='Light Grid Accent 1')
 
 doc.add_paragraph()
 
 margin_calc = doc.add_paragraph()
 margin_calc.add_run('Gross Margin Calculation:\n').bold = True
-margin_calc.add_run('Revenue: UGX 2,956,300/month\n')
-margin_calc.add_run('COGS: UGX 1,017,500/month\n')
-margin_calc.add_run('Gross Profit: UGX 1,938,800/month per customer\n')
-margin_calc.add_run('Gross Margin: 65.6%')
+margin_calc.add_run(f'Revenue: {ugx(model.price)}/month\n')
+margin_calc.add_run(f'COGS: {ugx(model.cogs)}/month\n')
+margin_calc.add_run(f'Gross Profit: {ugx(model.contribution)}/month per customer\n')
+margin_calc.add_run(f'Gross Margin: {model.gross_margin:.1%}')
 
 doc.add_heading('Break-Even Analysis', 2)
 
 breakeven = doc.add_paragraph()
-breakeven.add_run('Fixed Costs (estimated monthly): UGX 18,500,000\n').bold = True
-breakeven.add_run('  - Founder salary/living expenses: UGX 11,100,000\n')
-breakeven.add_run('  - Marketing & content: UGX 4,440,000\n')
-breakeven.add_run('  - Tools/infrastructure: UGX 2,960,000\n\n')
+breakeven.add_run(f'Fixed Costs (estimated monthly): {ugx(model.fixed_costs)}\n').bold = True
+for name, amount in model.fixed_cost_lines():
+    breakeven.add_run(f'  - {name}: {ugx(amount)}\n')
+breakeven.add_run('\n')
 breakeven.add_run('Break-Even Point: \n').bold = True
-breakeven.add_run('UGX 18,500,000 ÷ UGX 1,938,800 contribution per Silver customer = 9.5 customers\n')
-breakeven.add_run('\nConservative Estimate: 12-16 Silver tier customers = profitability\n\n')
+breakeven.add_run(
+    f'{ugx(model.fixed_costs)} ÷ {ugx(model.contribution)} contribution per Silver customer = '
+    f'{model.break_even_point:.1f} customers, i.e. {model.break_even_customers} paying customers\n'
+)
+needed = scenario_rows(scenarios)[-1]
+breakeven.add_run(
+    f'\nConservative Estimate: {needed[2]}-{needed[1]} Silver tier customers = profitability '
+    '(P50-P10 of the scenarios below, with cost overruns and exchange rate swings)\n\n'
+)
 breakeven.add_run('Timeline: Achievable by Day 80-90 with 3-5 pilot conversions + 5-10 new sales')
 
 doc.add_heading('Revenue Projection - First 6 Months', 2)
 
-revenue_table = doc.add_table(rows=8, cols=4)
-revenue_table.style = 'Light Grid Accent 1'
-
-revenue_rows = [
-    ('Month', 'Customers', 'MRR (Avg UGX 2,956,300)', 'Setup Fee Revenue'),
-    ('Month 1 (Days 1-30)', '0', 'UGX 0', 'UGX 0'),
-    ('Month 2 (Days 31-60)', '3-5', 'UGX 8,868,900-14,781,500', 'UGX 22,200,000-37,000,000'),
-    ('Month 3 (Days 61-90)', '12-18', 'UGX 35,475,600-53,213,400', 'UGX 14,800,000-29,600,000'),
-    ('Month 4', '18-25', 'UGX 53,213,400-73,907,500', 'UGX 14,800,000-29,600,000'),
-    ('Month 5', '25-35', 'UGX 73,907,500-103,470,500', 'UGX 14,800,000-29,600,000'),
-    ('Month 6', '35-45', 'UGX 103,470,500-133,033,500', 'UGX 7,400,000-22,200,000'),
-]
-
-for i, row_data in enumerate(revenue_rows):
-    cells = revenue_table.rows[i].cells
-    for j, text in enumerate(row_data):
-        cells[j].text = text
+revenue_table = table_from_rows(doc, model.revenue_rows(), style='Light Grid Accent 1')
 
 doc.add_paragraph()
 revenue_note = doc.add_paragraph()
+total_low, total_high = model.total_revenue()
+mrr_low, mrr_high = model.final_mrr()
 revenue_note.add_run('Total Revenue Projection (6 months): ').bold = True
-revenue_note.add_run('UGX 462,500,000 - UGX 740,000,000 (including setup fees)\n')
-revenue_note.add_run('By Month 6 MRR: UGX 103,470,500 - UGX 133,033,500 (35-45 customers)')
+revenue_note.add_run(f'{ugx(total_low)} - {ugx(total_high)} (including setup fees)\n')
+revenue_note.add_run(f'By Month 6 MRR: {ugx(mrr_low)} - {ugx(mrr_high)} ({count_range(*model.final_customers())} customers)')
+
+doc.add_heading('Scenario Ranges', 2)
+doc.add_paragraph(
+    f'{len(scenarios["final_mrr"]):,} simulated scenarios varying customers won each month, churn (0-4%/month), '
+    'cost overruns (-10% to +25%) and the exchange rate for USD-billed services.'
+)
+table_from_rows(doc, scenario_rows(scenarios), style='Light Grid Accent 1')
+doc.add_paragraph(f'Profitable by Month 6 in {break_even_share(scenarios):.0%} of scenarios.')
 
-doc.save(r'90-Day Action Plan - AI HIV Automation (Western Uganda).docx')
+trace.section(None)
+with trace.span('Save', doc):
+    save_output(doc, OUTPUT, build_key)
 print('[OK] 90-Day Action Plan created successfully')
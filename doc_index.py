@@ -0,0 +1,214 @@
+"""Incremental full-text index over every .docx under a folder, zipped ones included.
+
+Each .docx is read by streaming word/document.xml through lxml's iterparse,
+so nothing is extracted to disk. Documents inside .zip archives (IHM-main.zip)
+are indexed as "archive.zip!member.docx" and read straight from the archive.
+
+The index is saved to .build_cache/doc_index.pickle with a stamp per
+document: size and mtime for files, and CRC and size from the archive
+directory for zipped ones. An update re-reads only new or changed documents
+and drops deleted ones. Queries are phrase matches on lower-cased word tokens
+against positional postings, so "UGX 2,956,300" or "Mbarara Regional" finds
+every version that mentions it without opening any document.
+
+Usage: python doc_index.py [--root DIR] [--rebuild] PHRASE [PHRASE ...]
+"""
+import bisect
+import os
+import pickle
+import re
+import sys
+import time
+import zipfile
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+from lxml import etree
+from build_cache import CACHE_DIR
+
+INDEX_PATH = os.path.join(CACHE_DIR, 'doc_index.pickle')
+INDEX_VERSION = 1
+SKIP_DIRS = {'node_modules', '__pycache__'}
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+TOKEN = re.compile(r'\w+')
+
+
+def tokenize(text):
+    return TOKEN.findall(text.lower())
+
+
+def paragraphs(docx_file):
+    """Yield paragraph texts from an open .docx (path or file object) without loading it whole"""
+    with zipfile.ZipFile(docx_file) as package:
+        with package.open('word/document.xml') as xml:
+            for _, p in etree.iterparse(xml, events=('end',), tag=f'{W}p'):
+                yield ''.join((node.text or '') if node.tag == f'{W}t' else '\t'
+                              for node in p.iter(f'{W}t', f'{W}tab'))
+                # Drop what has been read so memory stays flat
+                p.clear()
+                while p.getprevious() is not None and p.getparent().tag == f'{W}body':
+                    del p.getparent()[0]
+
+
+def _record(docx_file, stamp):
+    """Positional postings plus the paragraph texts, for snippets"""
+    postings = defaultdict(list)
+    texts = []
+    starts = []
+    position = 0
+    for text in paragraphs(docx_file):
+        if not text.strip():
+            continue
+        texts.append(text)
+        starts.append(position)
+        for token in tokenize(text):
+            postings[token].append(position)
+            position += 1
+        position += 1  # so phrases never match across paragraphs
+    return {'stamp': stamp, 'postings': dict(postings), 'texts': texts, 'starts': starts}
+
+
+def discover(root):
+    """{doc id: (stamp, opener)} for every .docx under `root`, including inside .zip files
+
+    `opener()` is a context manager giving a path or file object for paragraphs().
+    """
+    found = {}
+    for folder, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d not in SKIP_DIRS)
+        for name in sorted(files):
+            path = os.path.join(folder, name)
+            doc_id = os.path.relpath(path, root)
+            if name.startswith('~$'):
+                continue  # Word lock files
+            if name.endswith('.docx'):
+                st = os.stat(path)
+                found[doc_id] = ((st.st_size, st.st_mtime_ns), lambda path=path: nullcontext(path))
+            elif name.endswith('.zip'):
+                try:
+                    with zipfile.ZipFile(path) as archive:
+                        members = [m for m in archive.infolist() if m.filename.endswith('.docx')
+                                   and not os.path.basename(m.filename).startswith('~$')]
+                except zipfile.BadZipFile:
+                    continue
+                for member in members:
+                    found[f'{doc_id}!{member.filename}'] = (
+                        (member.CRC, member.file_size),
+                        lambda path=path, member=member.filename: _nested(path, member),
+                    )
+    return found
+
+
+@contextmanager
+def _nested(archive_path, member):
+    # The member stream is seekable, so the nested zip reads straight out of
+    # the archive; the archive has to stay open while it does
+    with zipfile.ZipFile(archive_path) as archive, archive.open(member) as docx_file:
+        yield docx_file
+
+
+class DocIndex:
+    def __init__(self, root='.', path=INDEX_PATH):
+        self.root = root
+        self.path = path
+        self.docs = {}
+        self.terms = defaultdict(dict)  # token -> {doc id: positions}
+
+    @classmethod
+    def load(cls, root='.', path=INDEX_PATH):
+        index = cls(root, path)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                saved = pickle.load(f)
+            if saved.get('version') == INDEX_VERSION and saved.get('root') == os.path.abspath(root):
+                for doc_id, record in saved['docs'].items():
+                    index._add(doc_id, record)
+        return index
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        staging = self.path + '.tmp'
+        with open(staging, 'wb') as f:
+            pickle.dump({'version': INDEX_VERSION, 'root': os.path.abspath(self.root), 'docs': self.docs}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(staging, self.path)
+
+    def _add(self, doc_id, record):
+        self.docs[doc_id] = record
+        for token, positions in record['postings'].items():
+            self.terms[token][doc_id] = positions
+
+    def _remove(self, doc_id):
+        record = self.docs.pop(doc_id)
+        for token in record['postings']:
+            del self.terms[token][doc_id]
+            if not self.terms[token]:
+                del self.terms[token]
+
+    def update(self):
+        """Re-index new and changed documents, drop deleted ones; returns (indexed, removed)"""
+        found = discover(self.root)
+        removed = [doc_id for doc_id in self.docs if doc_id not in found]
+        for doc_id in removed:
+            self._remove(doc_id)
+        indexed = []
+        for doc_id, (stamp, opener) in found.items():
+            if doc_id in self.docs and self.docs[doc_id]['stamp'] == stamp:
+                continue
+            try:
+                with opener() as docx_file:
+                    record = _record(docx_file, stamp)
+            except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError):
+                continue  # not a Word document after all
+            if doc_id in self.docs:
+                self._remove(doc_id)
+            self._add(doc_id, record)
+            indexed.append(doc_id)
+        return indexed, removed
+
+    def search(self, phrase):
+        """[(doc id, [matching paragraph, ...])] for documents containing `phrase`"""
+        tokens = tokenize(phrase)
+        if not tokens:
+            return []
+        postings = [self.terms.get(token, {}) for token in tokens]
+        # Start from the rarest token's documents
+        candidates = min(postings, key=len)
+        results = []
+        for doc_id in candidates:
+            if not all(doc_id in p for p in postings):
+                continue
+            first = postings[0][doc_id]
+            rest = [set(p[doc_id]) for p in postings[1:]]
+            hits = [pos for pos in first if all(pos + i in s for i, s in enumerate(rest, start=1))]
+            if hits:
+                results.append((doc_id, self._snippets(doc_id, hits)))
+        return sorted(results)
+
+    def _snippets(self, doc_id, hits):
+        record = self.docs[doc_id]
+        found = sorted({bisect.bisect_right(record['starts'], pos) - 1 for pos in hits})
+        return [record['texts'][i] for i in found]
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    root = args[args.index('--root') + 1] if '--root' in args else '.'
+    phrases = [a for i, a in enumerate(args) if not a.startswith('--') and (i == 0 or args[i - 1] != '--root')]
+
+    start = time.perf_counter()
+    index = DocIndex(root) if '--rebuild' in args else DocIndex.load(root)
+    indexed, removed = index.update()
+    if indexed or removed:
+        index.save()
+    print(f'[OK] {len(index.docs)} documents indexed ({len(indexed)} updated, {len(removed)} removed) '
+          f'in {(time.perf_counter() - start) * 1000:.0f}ms')
+
+    for phrase in phrases:
+        start = time.perf_counter()
+        results = index.search(phrase)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f'\n"{phrase}": {len(results)} documents ({elapsed:.2f}ms)')
+        for doc_id, snippets in results:
+            print(f'  {doc_id}  ({len(snippets)} paragraphs)')
+            print(f'      {snippets[0][:100]}')
@@ -0,0 +1,206 @@
+"""Render doc_spec ops to DOCX, HTML and Markdown in one pass.
+
+The module descriptions and pricing tiers appear in the action plan .docx and
+on the marketing site. The generators describe that content once as ops (see
+doc_spec) and `render` walks the ops a single time, handing each one to every
+renderer:
+
+    elements, html, markdown = render(ops, DocxRenderer(doc), HtmlRenderer(), MarkdownRenderer())
+    write_partial('pricing', html, markdown)
+
+`DocxRenderer` appends to the end of the body, as doc.add_paragraph would.
+`write_partial` writes pages/partials/<name>.html and <name>.md and refreshes
+the region between <!-- ihm:<name> --> and <!-- /ihm:<name> --> in any page
+under pages/ that has one (pricing.html and features.html do).
+`sync_pages` does the page half alone from the partial already on disk.
+Files whose content did not change are not rewritten.
+
+Paragraph styles map to markup: Title and Heading N become h1/hN (# / ##),
+List Bullet becomes list items, bold runs become <strong> (**). Empty
+paragraphs and page breaks only matter to the .docx.
+"""
+import glob
+import html
+import os
+import re
+
+from doc_spec import build_elements
+from docx_splice import splice_before
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PAGES_DIR = os.path.join(HERE, 'pages')
+PARTIALS_DIR = os.path.join(PAGES_DIR, 'partials')
+TABLE_CLASS = 'table table-bordered'
+
+
+def heading_level(style):
+    """1-6 for Title / Heading N, otherwise None"""
+    if style == 'Title':
+        return 1
+    if style and style.startswith('Heading '):
+        return min(int(style.split()[1]), 6)
+    return None
+
+
+def _is_bullet(style):
+    return bool(style) and style.startswith('List Bullet')
+
+
+class DocxRenderer:
+    def __init__(self, doc):
+        self.doc = doc
+        self.elements = []
+
+    def add(self, op):
+        self.elements += build_elements(self.doc, [op])
+
+    def close(self):
+        splice_before(self.doc.element.body.sectPr, self.elements)
+        return self.elements
+
+
+class HtmlRenderer:
+    def __init__(self):
+        self.lines = []
+        self.in_list = False
+
+    def _list(self, wanted):
+        if wanted != self.in_list:
+            self.lines.append('<ul>' if wanted else '</ul>')
+            self.in_list = wanted
+
+    @staticmethod
+    def _text(text):
+        return html.escape(text).replace('\n', '<br>\n')
+
+    def _block(self, markup, style):
+        level = heading_level(style)
+        self._list(_is_bullet(style))
+        if level:
+            self.lines.append(f'<h{level}>{markup}</h{level}>')
+        elif self.in_list:
+            self.lines.append(f'  <li>{markup}</li>')
+        else:
+            self.lines.append(f'<p>{markup}</p>')
+
+    def add(self, op):
+        if op[0] == 'p' and op[1].strip():
+            self._block(self._text(op[1]), op[2])
+        elif op[0] == 'runs':
+            self._block(''.join(f'<strong>{self._text(text)}</strong>' if bold else self._text(text)
+                                for text, bold in op[1]), op[2])
+        elif op[0] == 'table' and op[1]:
+            self._list(False)
+            head, *rows = op[1]
+            self.lines.append(f'<table class="{TABLE_CLASS}">')
+            self.lines.append('  <thead><tr>' + ''.join(f'<th>{self._text(str(c))}</th>' for c in head)
+                              + '</tr></thead>')
+            self.lines.append('  <tbody>')
+            for row in rows:
+                self.lines.append('    <tr>' + ''.join(f'<td>{self._text(str(c))}</td>' for c in row) + '</tr>')
+            self.lines.append('  </tbody>')
+            self.lines.append('</table>')
+
+    def close(self):
+        self._list(False)
+        return '\n'.join(self.lines) + '\n'
+
+
+class MarkdownRenderer:
+    def __init__(self):
+        self.blocks = []
+        self.in_list = False
+
+    @staticmethod
+    def _text(text):
+        return re.sub(r'([\\`*_|<>\[\]])', r'\\\1', text).replace('\n', '  \n')
+
+    @classmethod
+    def _bold(cls, text):
+        # Markdown needs the ** hard against the words
+        stripped = text.strip()
+        if not stripped:
+            return text
+        lead, trail = text[:len(text) - len(text.lstrip())], text[len(text.rstrip()):]
+        return f'{lead}**{cls._text(stripped)}**{trail}'
+
+    def _block(self, markup, style):
+        level = heading_level(style)
+        if _is_bullet(style) and not level:
+            line = f'- {markup}'
+            if self.in_list:
+                self.blocks[-1] += '\n' + line
+            else:
+                self.blocks.append(line)
+            self.in_list = True
+            return
+        self.in_list = False
+        self.blocks.append(f'{"#" * level} {markup}' if level else markup)
+
+    def add(self, op):
+        if op[0] == 'p' and op[1].strip():
+            self._block(self._text(op[1]), op[2])
+        elif op[0] == 'runs':
+            self._block(''.join(self._bold(text) if bold else self._text(text) for text, bold in op[1]), op[2])
+        elif op[0] == 'table' and op[1]:
+            self.in_list = False
+            head, *rows = op[1]
+            lines = ['| ' + ' | '.join(self._text(str(c)) for c in head) + ' |',
+                     '|' + '---|' * len(head)]
+            lines += ['| ' + ' | '.join(self._text(str(c)) for c in row) + ' |' for row in rows]
+            self.blocks.append('\n'.join(lines))
+
+    def close(self):
+        return '\n\n'.join(self.blocks) + '\n'
+
+
+def render(ops, *renderers):
+    """Feed every op to every renderer in one traversal; returns each renderer's output"""
+    for op in ops:
+        for renderer in renderers:
+            renderer.add(op)
+    return [renderer.close() for renderer in renderers]
+
+
+def partial_paths(name, folder=PARTIALS_DIR):
+    return os.path.join(folder, f'{name}.html'), os.path.join(folder, f'{name}.md')
+
+
+def _write_if_changed(path, text):
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    staging = path + '.tmp'
+    with open(staging, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text)
+    os.replace(staging, path)
+    return True
+
+
+def inject(page_html, name, fragment):
+    """`page_html` with the <!-- ihm:name --> region replaced by `fragment`"""
+    pattern = re.compile(rf'(<!-- ihm:{re.escape(name)} -->\n?)(.*?)([ \t]*<!-- /ihm:{re.escape(name)} -->)', re.S)
+    return pattern.sub(lambda m: m.group(1) + fragment + m.group(3), page_html)
+
+
+def write_partial(name, html_text, markdown, folder=PARTIALS_DIR, pages_dir=PAGES_DIR):
+    """Write the partials and refresh marked page regions; returns the files changed"""
+    os.makedirs(folder, exist_ok=True)
+    html_path, md_path = partial_paths(name, folder)
+    changed = [path for path, text in [(html_path, html_text), (md_path, markdown)] if _write_if_changed(path, text)]
+    return changed + sync_pages(name, html_text, pages_dir)
+
+
+def sync_pages(name, html_text=None, pages_dir=PAGES_DIR):
+    """Refresh the marked regions for `name` (from the existing partial by default); returns the pages changed"""
+    if html_text is None:
+        with open(partial_paths(name)[0], encoding='utf-8') as f:
+            html_text = f.read()
+    changed = []
+    for page in sorted(glob.glob(os.path.join(pages_dir, '*.html'))):
+        with open(page, encoding='utf-8') as f:
+            current = f.read()
+        if f'<!-- ihm:{name} -->' in current and _write_if_changed(page, inject(current, name, html_text)):
+            changed.append(page)
+    return changed
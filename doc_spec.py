@@ -0,0 +1,227 @@
+"""Declarative document content in specs/*.json, compiled once and replayed.
+
+A spec is {"blocks": [...]} using the same block vocabulary as the render
+server, plus includes for content shared between documents:
+
+    {"heading": "Maternal Health Tracking", "level": 2}
+    {"paragraph": "Text", "style": "List Bullet"}
+    {"runs": [["Bold: ", true], ["plain", false]], "style": "List Bullet"}
+    {"table": [["Tier", "Price"], ["Silver", "UGX 2,956,300"]], "style": "Light Grid Accent 1"}
+    {"page_break": true}
+    {"include": "integrated_features"}
+
+`compile_spec(name)` turns a spec into a flat tuple of ops with includes
+expanded. Each spec is compiled once per process and reused until its file's
+mtime or size changes (compiling is cheaper than reading a cached copy back
+from disk, so the ops are not stored):
+
+    ('p', text, style)   ('runs', ((text, True or None), ...), style)
+    ('table', (row, ...), style)   ('break',)
+
+`docx_fragment(doc, name)` replays the ops as detached python-docx elements
+ready for docx_splice.splice_before, and `upsert_spec` keeps them in place as
+a managed section fingerprinted by the compiled spec. The serialized XML is
+cached under .build_cache/specs, keyed by the ops and the style ids / page width of the target document, so a
+re-render parses stored XML instead of building every paragraph in Python.
+Other renderers can walk the same ops.
+
+Data records (the prospect lists) also live in specs/ and load with
+`load_data(name)`.
+"""
+import hashlib
+import json
+import os
+import re
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_BREAK
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls
+from docx.text.run import Run
+from lxml import etree
+from build_cache import CACHE_DIR
+from docx_splice import paragraph_element, section_bookmark, upsert_before
+from docx_tables import ROWS_PER_CHUNK, table_element
+
+SPEC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'specs')
+IR_CACHE = os.path.join(CACHE_DIR, 'specs')  # docx_fragment's serialized XML
+IR_VERSION = '2'
+
+_compiled = {}
+
+
+def spec_path(name):
+    if not re.fullmatch(r'[\w-]+', name):
+        raise ValueError(f'Bad spec name {name!r}')
+    path = os.path.join(SPEC_DIR, f'{name}.json')
+    if not os.path.exists(path):
+        raise KeyError(f'No spec named {name!r} in {SPEC_DIR}')
+    return path
+
+
+def load_data(name):
+    with open(spec_path(name), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _digest(*parts):
+    return hashlib.sha256('\0'.join(parts).encode()).hexdigest()[:32]
+
+
+def _write_json(path, value):
+    # Written aside and swapped in, so a concurrent reader never sees half a file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    staging = f'{path}.{os.getpid()}.tmp'
+    with open(staging, 'w', encoding='utf-8') as f:
+        json.dump(value, f, ensure_ascii=False)
+    os.replace(staging, path)
+
+
+JSON_TYPES = {dict: 'an object', list: 'an array', str: 'a string'}
+
+
+def _checked(value, kind, what):
+    if not isinstance(value, kind):
+        raise TypeError(f'{what} must be {JSON_TYPES[kind]}, not {type(value).__name__}')
+    return value
+
+
+def compile_block(block, include=None):
+    """The ops for one block dict; `include` resolves {"include": name}
+
+    A block of the wrong shape raises TypeError or ValueError (the render
+    server answers those with 400) rather than failing halfway through a render.
+    """
+    _checked(block, dict, 'A block')
+    style = block.get('style')
+    if style is not None:
+        _checked(style, str, '"style"')
+    if 'heading' in block:
+        level = block.get('level', 1)
+        if not isinstance(level, int) or isinstance(level, bool) or not 0 <= level <= 9:
+            raise ValueError(f'"level" must be 0-9, not {level!r}')
+        return [('p', _checked(block['heading'], str, '"heading"'), 'Title' if level == 0 else f'Heading {level}')]
+    if 'paragraph' in block:
+        return [('p', _checked(block['paragraph'], str, '"paragraph"'), style)]
+    if 'runs' in block:
+        runs = [_checked(run, list, 'A run') for run in _checked(block['runs'], list, '"runs"')]
+        if any(len(run) != 2 for run in runs):
+            raise ValueError('A run must be [text, bold]')
+        # A plain run inherits its weight rather than switching bold off
+        return [('runs', tuple((_checked(text, str, 'Run text'), True if bold else None) for text, bold in runs), style)]
+    if 'table' in block:
+        rows = [_checked(row, list, 'A table row') for row in _checked(block['table'], list, '"table"')]
+        return [('table', tuple(tuple(row) for row in rows), style)]
+    if block.get('page_break'):
+        return [('break',)]
+    if 'include' in block and include is not None:
+        return list(include(_checked(block['include'], str, '"include"')))
+    raise ValueError(f'Unknown block: {sorted(block)}')
+
+
+def compile_blocks(blocks, include=None):
+    ops = []
+    for block in blocks:
+        ops += compile_block(block, include or compile_spec)
+    return tuple(ops)
+
+
+def _spec_stamp(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def compile_spec(name):
+    """The ops for specs/<name>.json, compiled once per process while the file is unchanged"""
+    path = spec_path(name)
+    stamp = _spec_stamp(path)
+    entry = _compiled.get(name)
+    if entry is not None and entry[2] == stamp:
+        # An include that changed makes its includers stale too
+        for included, _ in entry[3]:
+            compile_spec(included)
+        if all(_compiled[included][1] == key for included, key in entry[3]):
+            return entry[0]
+    with open(path, 'rb') as f:
+        source = f.read()
+    spec = json.loads(source)
+    includes = [block['include'] for block in spec['blocks'] if 'include' in block]
+    for included in includes:
+        compile_spec(included)
+    key = _digest(IR_VERSION, name, hashlib.sha256(source).hexdigest(), *(_compiled[i][1] for i in includes))
+    ops = compile_blocks(spec['blocks'])
+    _compiled[name] = (ops, key, stamp, tuple((i, _compiled[i][1]) for i in includes))
+    return ops
+
+
+def _style_context(doc, ops):
+    """Everything about `doc` that changes the XML built for `ops`"""
+    styles = set()
+    for op in ops:
+        if op[0] == 'table' and op[2] is not None:
+            styles.add((op[2], WD_STYLE_TYPE.TABLE))
+        elif op[0] in ('p', 'runs') and op[2] is not None:
+            styles.add((op[2], WD_STYLE_TYPE.PARAGRAPH))
+    ids = sorted((style, int(kind), str(doc.part.get_style_id(style, kind))) for style, kind in styles)
+    return json.dumps([ids, doc._block_width.twips])
+
+
+def build_elements(doc, ops):
+    """Detached python-docx elements for `ops`, in order"""
+    style_ids = {}
+    elements = []
+    for op in ops:
+        if op[0] == 'p':
+            elements.append(paragraph_element(doc, op[1], op[2], style_ids))
+        elif op[0] == 'runs':
+            p = paragraph_element(doc, '', op[2], style_ids)
+            for text, bold in op[1]:
+                run = Run(p.add_r(), None)
+                run.text = text
+                if bold is not None:  # None inherits, as add_run does
+                    run.bold = bold
+            elements.append(p)
+        elif op[0] == 'table':
+            table = table_element(doc, op[1], op[2])
+            if table is not None:
+                elements.append(table)
+        elif op[0] == 'break':
+            p = OxmlElement('w:p')
+            Run(p.add_r(), None).add_break(WD_BREAK.PAGE)
+            elements.append(p)
+    return elements
+
+
+def _parse_fragment(markup):
+    # Parse a chunk at a time; lxml slows down moving one huge subtree (see docx_tables)
+    elements = []
+    for i in range(0, len(markup), ROWS_PER_CHUNK):
+        wrapper = parse_xml(f"<w:body {nsdecls('w')}>{''.join(markup[i:i + ROWS_PER_CHUNK])}</w:body>")
+        elements += list(wrapper)
+    return elements
+
+
+def docx_fragment(doc, name):
+    """Detached elements for specs/<name>.json, replayed from cached XML when possible"""
+    ops = compile_spec(name)
+    key = _digest(IR_VERSION, _compiled[name][1], _style_context(doc, ops))
+    cached = os.path.join(IR_CACHE, f'{name}.{key}.xml.json')
+    if os.path.exists(cached):
+        with open(cached, encoding='utf-8') as f:
+            return _parse_fragment(json.load(f))
+    elements = build_elements(doc, ops)
+    _write_json(cached, [etree.tostring(e, encoding='unicode') for e in elements])
+    return elements
+
+
+def spec_bookmark(name, section=None):
+    """The bookmark `upsert_spec` leaves around a current copy of specs/<name>.json"""
+    compile_spec(name)
+    return section_bookmark(section or name, _compiled[name][1])
+
+
+def upsert_spec(doc, anchor, name, section=None):
+    """Insert or refresh specs/<name>.json before `anchor`; False when already current"""
+    ops = compile_spec(name)
+    texts = {op[1] for op in ops if op[0] == 'p'}
+    return upsert_before(anchor, section or name, _compiled[name][1], lambda: docx_fragment(doc, name), adopt=texts)
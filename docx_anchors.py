@@ -0,0 +1,45 @@
+"""Anchor lookup and insertion helpers for python-docx documents.
+
+`doc.paragraphs` rebuilds the whole paragraph list every time it is read, so
+indexing into it inside an insertion loop is quadratic in document size.
+`find_anchors` walks the body once and returns the anchor paragraphs
+themselves; `insert_before` then splices each new paragraph in front of the
+anchor element directly, which costs the same no matter how long the document is.
+"""
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+
+
+def find_anchors(doc, *anchors):
+    """Return {anchor text: first body paragraph containing it} from one pass"""
+    found = {}
+    pending = list(anchors)
+    for p in doc.element.body.iterchildren(qn('w:p')):
+        if not pending:
+            break
+        text = p.text
+        for anchor in list(pending):
+            if anchor in text:
+                found[anchor] = Paragraph(p, doc._body)
+                pending.remove(anchor)
+    return found
+
+
+def find_anchor(doc, anchor):
+    """Return the first body paragraph containing `anchor`, or None"""
+    return find_anchors(doc, anchor).get(anchor)
+
+
+def insert_before(anchor, rows):
+    """Insert (text, style) rows in order directly before the anchor paragraph"""
+    # Style lookups scan the styles part, so resolve each name only once
+    style_ids = {}
+    inserted = []
+    for text, style in rows:
+        if style not in style_ids:
+            style_ids[style] = anchor.part.get_style_id(style, WD_STYLE_TYPE.PARAGRAPH)
+        paragraph = anchor.insert_paragraph_before(text)
+        paragraph._p.style = style_ids[style]
+        inserted.append(paragraph)
+    return inserted
@@ -0,0 +1,117 @@
+"""Swap a rebuilt document in for the original without a window where it is missing.
+
+`finalize(updated, original, backup)` waits until neither file is held open
+(probing with exponential backoff instead of sleeping a fixed time), fsyncs
+the new file, keeps the current original as a versioned backup and then
+moves the new file over the original with a single os.replace. If anything
+fails before that last step the original is left untouched.
+
+A file counts as held while it, or the owner file Word keeps next to an open
+document (~$ plus the name minus its first two characters), cannot be opened
+for writing or locked. A leftover owner file that opens fine is stale and
+does not block.
+
+Backups rotate: `backup` is always the most recent previous version and
+older ones move to backup.1, backup.2 ..., keeping `keep` versions in all.
+"""
+import os
+import shutil
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: opening a file Word holds fails on its own
+    fcntl = None
+
+TIMEOUT = 30.0
+FIRST_DELAY = 0.01
+MAX_DELAY = 0.5
+KEEP_BACKUPS = 3
+
+
+def owner_files(path):
+    """Where Word would put the ~$ owner file for `path`"""
+    folder, name = os.path.split(path)
+    return [os.path.join(folder, '~$' + name[2:]), os.path.join(folder, '~$' + name)]
+
+
+def _held(path):
+    try:
+        with open(path, 'r+b') as f:
+            if fcntl is not None:
+                fcntl.lockf(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.lockf(f, fcntl.LOCK_UN)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        return True
+    return False
+
+
+def is_locked(path):
+    return any(_held(p) for p in [path, *owner_files(path)])
+
+
+def wait_until_released(*paths, timeout=TIMEOUT):
+    """Return once none of `paths` is locked; raise TimeoutError otherwise"""
+    deadline = time.monotonic() + timeout
+    delay = FIRST_DELAY
+    while True:
+        locked = [p for p in paths if is_locked(p)]
+        if not locked:
+            return
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f'Still open after {timeout:.0f}s: {", ".join(locked)}')
+        time.sleep(delay)
+        delay = min(delay * 2, MAX_DELAY)
+
+
+def _fsync_file(path):
+    with open(path, 'r+b') as f:
+        os.fsync(f.fileno())
+
+
+def _fsync_dir(folder):
+    if os.name != 'posix':
+        return
+    fd = os.open(folder or '.', os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def versioned(path, n):
+    stem, ext = os.path.splitext(path)
+    return f'{stem}.{n}{ext}'
+
+
+def _rotate_backups(backup, keep):
+    for n in range(keep - 1, 0, -1):
+        older = versioned(backup, n - 1) if n > 1 else backup
+        if os.path.exists(older):
+            os.replace(older, versioned(backup, n))
+
+
+def _snapshot(original, backup):
+    """Copy `original` to `backup` atomically, by hard link where possible"""
+    staging = backup + '.tmp'
+    if os.path.exists(staging):
+        os.remove(staging)
+    try:
+        os.link(original, staging)
+    except OSError:
+        shutil.copy2(original, staging)
+        _fsync_file(staging)
+    os.replace(staging, backup)
+
+
+def finalize(updated, original, backup=None, keep=KEEP_BACKUPS, timeout=TIMEOUT):
+    """Atomically replace `original` with `updated`, keeping the old version in `backup`"""
+    wait_until_released(updated, original, timeout=timeout)
+    _fsync_file(updated)
+    if backup is not None and os.path.exists(original):
+        _rotate_backups(backup, keep)
+        _snapshot(original, backup)
+    os.replace(updated, original)
+    _fsync_dir(os.path.dirname(os.path.abspath(original)))
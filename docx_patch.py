@@ -0,0 +1,282 @@
+"""Targeted edits to the first body paragraphs of a .docx without a full load.
+
+`Document(path)` followed by `save` parses every part, then re-serializes
+and re-compresses all of them, media included, just to retitle a document.
+`patch_paragraphs` does much less:
+- scans word/document.xml only as far as the last paragraph it edits
+- re-parses just those paragraphs with lxml and splices them back in, so
+  every other byte of the part is left alone
+- copies every other zip member's compressed bytes and central directory
+  record verbatim
+
+    patch_paragraphs(path, [
+        (0, 'New title', 'Heading 1'),
+        (2, 'New third line', None),     # None keeps the paragraph style
+    ])
+
+Indexes count body-level paragraphs the way `doc.paragraphs` does; edits
+past the end are skipped. Text and styles are applied as python-docx's
+`paragraph.text` and `paragraph.style` setters would apply them. The current
+paragraphs are read first with docx_stream_reader.scan, and edits that would
+leave a paragraph's text and style as they are are dropped. With nothing
+left to change the file is not rewritten at all.
+"""
+import os
+import re
+import struct
+import sys
+import time
+import zipfile
+import zlib
+
+from lxml import etree
+from docx_stream_reader import scan
+
+DOCUMENT_PART = 'word/document.xml'
+STYLES_PART = 'word/styles.xml'
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+# Start tags, end tags and empty tags; comments and PIs never match
+TAG = re.compile(rb'<(/?)([A-Za-z_][^\s/>]*)[^>]*?(/?)>')
+NSDECL = re.compile(rb'\sxmlns:([A-Za-z_][\w.-]*)="([^"]*)"')
+STYLE = re.compile(rb'<w:style\b[^>]*?w:styleId="([^"]+)"[^>]*>\s*<w:name w:val="([^"]+)"')
+
+EOCD_SIG = b'PK\x05\x06'
+CENTRAL_SIG = b'PK\x01\x02'
+LOCAL_SIG = b'PK\x03\x04'
+DATA_DESCRIPTOR_FLAG = 0x08
+
+
+def _w(tag):
+    return f'{{{W_NS}}}{tag}'
+
+
+# -- zip members ----------------------------------------------------------
+
+def _central_directory(data):
+    """[(name, central record, local header offset)] in directory order, plus the EOCD"""
+    end = data.rfind(EOCD_SIG, max(0, len(data) - 65557))
+    if end < 0:
+        raise ValueError('Not a zip file')
+    eocd = data[end:end + 22]
+    count, size, offset = struct.unpack('<HII', eocd[10:20])
+    if offset == 0xFFFFFFFF or count == 0xFFFF:
+        raise ValueError('Zip64 packages are not supported')
+    entries = []
+    pos = offset
+    for _ in range(count):
+        if data[pos:pos + 4] != CENTRAL_SIG:
+            raise ValueError('Corrupt central directory')
+        name_len, extra_len, comment_len = struct.unpack('<HHH', data[pos + 28:pos + 34])
+        record = data[pos:pos + 46 + name_len + extra_len + comment_len]
+        name = record[46:46 + name_len].decode('utf-8')
+        entries.append((name, record, struct.unpack('<I', record[42:46])[0]))
+        pos += len(record)
+    return entries, offset, eocd
+
+
+def _local_records(data, entries, cd_offset):
+    """Raw bytes of each member's local header, data and descriptor"""
+    starts = sorted(offset for _, _, offset in entries) + [cd_offset]
+    end_of = {start: starts[i + 1] for i, start in enumerate(starts[:-1])}
+    return {name: data[offset:end_of[offset]] for name, _, offset in entries}
+
+
+def _member_bytes(record, central):
+    method = struct.unpack('<H', central[10:12])[0]
+    size = struct.unpack('<I', central[20:24])[0]
+    name_len, extra_len = struct.unpack('<HH', record[26:30])
+    raw = record[30 + name_len + extra_len:][:size]
+    return zlib.decompress(raw, -15) if method == 8 else raw
+
+
+def _new_member(central, payload):
+    """Local record and updated central record for `payload`, deflated"""
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    raw = compressor.compress(payload) + compressor.flush()
+    crc = zlib.crc32(payload)
+    flags = struct.unpack('<H', central[8:10])[0] & ~DATA_DESCRIPTOR_FLAG
+    mod_time, mod_date = struct.unpack('<HH', central[12:16])
+    name_len = struct.unpack('<H', central[28:30])[0]
+    name = central[46:46 + name_len]
+    local = struct.pack('<4sHHHHHIIIHH', LOCAL_SIG, 20, flags, 8, mod_time, mod_date,
+                        crc, len(raw), len(payload), len(name), 0) + name + raw
+    central = (central[:8] + struct.pack('<HH', flags, 8) + central[12:16]
+               + struct.pack('<III', crc, len(raw), len(payload)) + central[28:])
+    return local, central
+
+
+def patch_part(path, part, transform, out_path=None):
+    """Rewrite one zip member through `transform(bytes) -> bytes`; copy the rest as stored"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    entries, cd_offset, eocd = _central_directory(data)
+    # Slices of a memoryview, so copied members are never duplicated in memory
+    records = _local_records(memoryview(data), entries, cd_offset)
+
+    out_path = out_path or path
+    staging = out_path + '.tmp'
+    directory = bytearray()
+    written = 0
+    with open(staging, 'wb') as f:
+        for name, central, _ in entries:
+            local = records[name]
+            if name == part:
+                local, central = _new_member(central, transform(_member_bytes(local, central)))
+            directory += central[:42] + struct.pack('<I', written) + central[46:]
+            written += f.write(local)
+        f.write(directory)
+        f.write(eocd[:12] + struct.pack('<II', len(directory), written) + eocd[20:])
+    os.replace(staging, out_path)
+
+
+def read_part(path, part):
+    # Only the one member is read and inflated
+    with zipfile.ZipFile(path) as package:
+        return package.read(part)
+
+
+# -- paragraphs -----------------------------------------------------------
+
+def body_paragraphs(xml, count):
+    """(start, end) byte spans of the first `count` body-level w:p elements"""
+    body = re.search(rb'<w:body\b[^>]*>', xml)
+    if body is None or count <= 0:
+        return []
+    spans = []
+    depth = 0
+    for m in TAG.finditer(xml, body.end()):
+        closing, name, empty = m.group(1), m.group(2), m.group(3)
+        if depth == 0:
+            if closing:
+                break  # </w:body>
+            start, child = m.start(), name
+            if not empty:
+                depth = 1
+                continue
+        elif closing:
+            depth -= 1
+            if depth:
+                continue
+        else:
+            depth += 0 if empty else 1
+            continue
+        if child == b'w:p':
+            spans.append((start, m.end()))
+            if len(spans) == count:
+                break
+    return spans
+
+
+def style_ids(styles_xml):
+    """Lower-cased style name -> style id, from word/styles.xml"""
+    return {name.decode().lower(): style_id.decode() for style_id, name in STYLE.findall(styles_xml)}
+
+
+def _set_text(p, text):
+    # paragraph.text = text: drop everything but pPr, then one run
+    for child in list(p):
+        if child.tag != _w('pPr'):
+            p.remove(child)
+    r = etree.SubElement(p, _w('r'))
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            etree.SubElement(r, _w('br'))
+        for j, piece in enumerate(line.split('\t')):
+            if j:
+                etree.SubElement(r, _w('tab'))
+            if piece:
+                t = etree.SubElement(r, _w('t'))
+                t.text = piece
+                if piece != piece.strip():
+                    t.set(XML_SPACE, 'preserve')
+
+
+def _set_style(p, style_id):
+    ppr = p.find(_w('pPr'))
+    if ppr is None:
+        ppr = etree.Element(_w('pPr'))
+        p.insert(0, ppr)
+    pstyle = ppr.find(_w('pStyle'))
+    if pstyle is None:
+        pstyle = etree.Element(_w('pStyle'))
+        ppr.insert(0, pstyle)
+    pstyle.set(_w('val'), style_id)
+
+
+def _patch_paragraph(fragment, nsdecls, text, style_id):
+    wrapper = etree.fromstring(b'<w:wrap ' + nsdecls + b'>' + fragment + b'</w:wrap>')
+    p = wrapper[0]
+    if text is not None:
+        _set_text(p, text)
+    if style_id is not None:
+        _set_style(p, style_id)
+    markup = etree.tostring(p, encoding='UTF-8', xml_declaration=False)
+    # The namespaces are already declared on w:document
+    head_end = markup.index(b'>')
+    return NSDECL.sub(b'', markup[:head_end]) + markup[head_end:]
+
+
+def _differs(position, text, style, ids):
+    if style is not None and style.lower() not in ids:
+        raise KeyError(f"no style with name '{style}'")
+    return ((text is not None and position.text != text)
+            or (style is not None and position.style != ids[style.lower()]))
+
+
+def patch_paragraphs(path, edits, out_path=None):
+    """Apply (index, text, style name) edits to body paragraphs; returns the indexes changed"""
+    edits = sorted(edits, key=lambda edit: edit[0])
+    ids = None
+    if any(style for _, _, style in edits):
+        ids = style_ids(read_part(path, STYLES_PART))
+    # Stream just the paragraphs being edited and drop edits that change nothing
+    current, _, _ = scan(path, count=edits[-1][0] + 1 if edits else 0)
+    edits = [(index, text, style) for index, text, style in edits
+             if index < len(current) and _differs(current[index], text, style, ids)]
+    if not edits and out_path is None:
+        return []
+    changed = []
+
+    def transform(xml):
+        root = re.search(rb'<w:document\b[^>]*>', xml)
+        nsdecls = b' '.join(m.group(0).strip() for m in NSDECL.finditer(root.group(0)))
+        spans = body_paragraphs(xml, edits[-1][0] + 1 if edits else 0)
+        parts = []
+        cursor = 0
+        for index, text, style in edits:
+            if index >= len(spans):
+                break
+            start, end = spans[index]
+            style_id = None if style is None else ids[style.lower()]
+            parts += [xml[cursor:start], _patch_paragraph(xml[start:end], nsdecls, text, style_id)]
+            cursor = end
+            changed.append(index)
+        return b''.join(parts) + xml[cursor:]
+
+    patch_part(path, DOCUMENT_PART, transform, out_path)
+    return changed
+
+
+if __name__ == '__main__':
+    # Compare against a full python-docx load and save: python docx_patch.py FILE.docx
+    import shutil
+    import tempfile
+    from docx import Document
+
+    source = sys.argv[1]
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path, patched_path = os.path.join(tmp, 'legacy.docx'), os.path.join(tmp, 'patched.docx')
+        shutil.copy(source, legacy_path)
+        start = time.perf_counter()
+        doc = Document(legacy_path)
+        doc.paragraphs[0].text = 'Patched title'
+        doc.save(legacy_path)
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        patch_paragraphs(source, [(0, 'Patched title', None)], patched_path)
+        patched = time.perf_counter() - start
+    print(f'python-docx load + save: {legacy * 1000:8.1f} ms')
+    print(f'patch_paragraphs:        {patched * 1000:8.1f} ms')
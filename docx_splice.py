@@ -0,0 +1,191 @@
+"""Build document content as a detached XML fragment and splice it in at once.
+
+Adding each paragraph at the end of the body and then moving it next to an
+anchor with `parent.index(...)` costs a scan of the body per paragraph.
+`build_fragment` creates the `w:p`/`w:tbl` elements outside the document tree
+and `splice_before` attaches the whole fragment in front of the anchor.
+
+A block is either a `(text, style)` pair for a paragraph or heading, e.g.
+`("Maternal Health Tracking", "Heading 2")`, or a `(rows, style)` pair where
+`rows` is a list of row tuples, e.g. `([('Tier', 'Price'), ...], 'Light Grid Accent 1')`.
+
+`upsert_before` keeps a generated section idempotent. The section sits between
+a hidden bookmark pair named `_ihm_<section>_<fingerprint>`. Re-running with
+the same fingerprint changes nothing. A new fingerprint replaces the section
+where it stands.
+"""
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx_tables import table_element
+
+
+def _style_id(doc, style, style_type, style_ids):
+    key = (style, style_type)
+    if key not in style_ids:
+        style_ids[key] = doc.part.get_style_id(style, style_type)
+    return style_ids[key]
+
+
+def paragraph_element(doc, text, style=None, style_ids=None):
+    """Return a detached `w:p` with `text` in a single run"""
+    style_ids = {} if style_ids is None else style_ids
+    p = OxmlElement('w:p')
+    if text:
+        p.add_r().text = text
+    if style is not None:
+        p.style = _style_id(doc, style, WD_STYLE_TYPE.PARAGRAPH, style_ids)
+    return p
+
+
+def build_fragment(doc, blocks):
+    """Return the detached elements for `blocks`, in document order"""
+    style_ids = {}
+    fragment = []
+    for content, style in blocks:
+        if isinstance(content, str):
+            fragment.append(paragraph_element(doc, content, style, style_ids))
+        else:
+            table = table_element(doc, content, style)
+            if table is not None:
+                fragment.append(table)
+    return fragment
+
+
+def splice_before(anchor, fragment):
+    """Attach a fragment directly before the anchor paragraph or its element"""
+    anchor_element = getattr(anchor, '_element', anchor)
+    parent = anchor_element.getparent()
+    if anchor_element.getnext() is None:
+        # The usual anchor is the body's closing sectPr: lift it off, attach the
+        # whole fragment with one extend and put it back. (Slice assignment
+        # would also be one call, but lxml walks to the index child by child.)
+        parent.remove(anchor_element)
+        parent.extend(fragment)
+        parent.append(anchor_element)
+        return fragment
+    # Mid-body there is no bulk insert; addprevious at least links each
+    # element in without a positional lookup
+    for element in fragment:
+        anchor_element.addprevious(element)
+    return fragment
+
+
+SECTION_PREFIX = '_ihm_'
+FINGERPRINT_CHARS = 12
+MAX_BOOKMARK_NAME = 40  # Word's limit
+
+
+def section_bookmark(section, fingerprint):
+    """The bookmark name marking `section` at `fingerprint`"""
+    name = f'{SECTION_PREFIX}{section}_{fingerprint[:FINGERPRINT_CHARS]}'
+    if len(name) > MAX_BOOKMARK_NAME:
+        raise ValueError(f'Section name too long for a bookmark: {section!r}')
+    return name
+
+
+def _top_level(body, element):
+    while element.getparent() is not body:
+        element = element.getparent()
+    return element
+
+
+def _section_marks(body, section):
+    """The (bookmarkStart, bookmarkEnd) pair around a managed section, or None"""
+    prefix = f'{SECTION_PREFIX}{section}_'
+    for start in body.iter(qn('w:bookmarkStart')):
+        if not start.get(qn('w:name'), '').startswith(prefix):
+            continue
+        for end in body.iter(qn('w:bookmarkEnd')):
+            if end.get(qn('w:id')) == start.get(qn('w:id')):
+                return start, end
+    return None
+
+
+def find_section(body, section):
+    """(first, last, fingerprint) for a managed section's body-level elements, or None"""
+    marks = _section_marks(body, section)
+    if marks is None:
+        return None
+    start, end = marks
+    # Word may move the markers into the neighbouring paragraphs on save
+    fingerprint = start.get(qn('w:name'))[len(f'{SECTION_PREFIX}{section}_'):]
+    return _top_level(body, start), _top_level(body, end), fingerprint
+
+
+def _stale_range(first, last, anchor_element):
+    """([elements first..last], insert position), stopping short of anything holding the anchor
+
+    A bookmarkEnd that Word moved into the anchor paragraph would otherwise
+    make the anchor the section's last element.
+    """
+    stale = []
+    element = first
+    while element is not None:
+        if element is anchor_element or anchor_element in element.iter(anchor_element.tag):
+            return stale, element
+        stale.append(element)
+        if element is last:
+            break
+        element = element.getnext()
+    return stale, last.getnext()
+
+
+def _legacy_run(anchor_element, texts):
+    """Unmarked copies of the section left before the anchor by earlier inserts"""
+    run = []
+    element = anchor_element.getprevious()
+    while element is not None and element.tag == qn('w:p') and element.text in texts:
+        run.append(element)
+        element = element.getprevious()
+    while run and not run[-1].text:
+        run.pop()  # blank lines above the copies belong to the document
+    return run
+
+
+def _bookmark(tag, mark_id, name=None):
+    mark = OxmlElement(tag)
+    mark.set(qn('w:id'), str(mark_id))
+    if name is not None:
+        mark.set(qn('w:name'), name)
+    return mark
+
+
+def upsert_before(anchor, section, fingerprint, build, adopt=()):
+    """Insert or refresh the managed `section`; returns False when it is already current
+
+    `build()` returns the section's fragment and is only called when the
+    stored fingerprint differs. Without a marked section, an unmarked run of
+    paragraphs right before the anchor whose texts are all in `adopt` is
+    taken to be an older copy and replaced.
+    """
+    anchor_element = getattr(anchor, '_element', anchor)
+    body = anchor_element.getparent()
+    fingerprint = fingerprint[:FINGERPRINT_CHARS]
+    name = section_bookmark(section, fingerprint)
+
+    found = find_section(body, section)
+    if found is not None:
+        first, last, current = found
+        if current == fingerprint:
+            return False
+        stale, position = _stale_range(first, last, anchor_element)
+        marks = _section_marks(body, section)
+    else:
+        stale = _legacy_run(anchor_element, set(adopt))
+        position = anchor_element
+        marks = ()
+
+    mark_id = 1 + max((int(mark.get(qn('w:id'))) for mark in body.iter(qn('w:bookmarkStart'))), default=-1)
+    for element in stale:
+        body.remove(element)
+    # Old markers left in kept paragraphs (the anchor, say) would shadow the new ones
+    for mark in marks:
+        if any(parent is body for parent in mark.iterancestors()):
+            mark.getparent().remove(mark)
+    fragment = [_bookmark('w:bookmarkStart', mark_id, name), *build(), _bookmark('w:bookmarkEnd', mark_id)]
+    if position is None:
+        body.extend(fragment)
+    else:
+        splice_before(position, fragment)
+    return True
@@ -0,0 +1,141 @@
+"""Read the start of a .docx body without loading the document.
+
+`Document(path)` parses every part and builds the whole body tree before a
+script can look at its first paragraph or find one heading. `scan` streams
+word/document.xml out of the zip through lxml's iterparse, keeps only the
+body element being read, and stops as soon as it has the first `count`
+paragraphs and every anchor. The rest of the part is never decompressed, so
+time and memory depend on how far in the targets sit, not on the document's
+length.
+
+    paragraphs, anchors, bookmarks = scan(path, count=3)
+    paragraphs, anchors, bookmarks = scan(path, anchors=['Prospecting & Outreach Strategy'])
+
+Paragraphs and anchors come back as Positions. `index` counts body
+paragraphs the way `doc.paragraphs` does, which is what
+docx_patch.patch_paragraphs takes. `child` is the element's index among the
+body children, as in `doc.element.body[child]`. `bookmarks` maps each
+bookmark name seen before the scan stopped to the child it sits in. That is
+how a current docx_splice section is spotted without a full load.
+"""
+import sys
+import time
+import zipfile
+from collections import namedtuple
+
+from lxml import etree
+
+DOCUMENT_PART = 'word/document.xml'
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+Position = namedtuple('Position', 'index child text style')
+
+
+def paragraph_text(p):
+    """The text python-docx's `paragraph.text` would give"""
+    parts = []
+    for item in p.iterchildren(f'{W}r', f'{W}hyperlink'):
+        # Runs directly in the paragraph or a hyperlink; not text boxes or tracked changes
+        for run in [item] if item.tag == f'{W}r' else item.iterchildren(f'{W}r'):
+            for node in run:
+                if node.tag == f'{W}t':
+                    parts.append(node.text or '')
+                elif node.tag in (f'{W}tab', f'{W}ptab'):
+                    parts.append('\t')
+                elif node.tag == f'{W}cr' or (node.tag == f'{W}br'
+                                               and node.get(f'{W}type') in (None, 'textWrapping')):
+                    parts.append('\n')
+                elif node.tag == f'{W}noBreakHyphen':
+                    parts.append('-')
+    return ''.join(parts)
+
+
+def paragraph_style(p):
+    pstyle = p.find(f'{W}pPr/{W}pStyle')
+    return None if pstyle is None else pstyle.get(f'{W}val')
+
+
+def body_children(xml):
+    """Yield (child index, element) for each body-level element of a document.xml stream
+
+    Each element is complete when yielded and is freed once the next one is
+    read, so hold on to what you need, not the element.
+    """
+    depth = 0
+    body_depth = None
+    child = 0
+    for event, element in etree.iterparse(xml, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if element.tag == f'{W}body':
+                body_depth = depth
+            continue
+        depth -= 1
+        if body_depth is None or depth != body_depth:
+            continue
+        yield child, element
+        child += 1
+        # Drop what has been read so memory stays flat
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def scan(path, count=0, anchors=()):
+    """([first `count` paragraphs], {anchor: first paragraph containing it}, {bookmark: child})"""
+    paragraphs = []
+    found = {}
+    bookmarks = {}
+    pending = list(anchors)
+    if count <= 0 and not pending:
+        return paragraphs, found, bookmarks
+    index = 0
+    with zipfile.ZipFile(path) as package, package.open(DOCUMENT_PART) as xml:
+        for child, element in body_children(xml):
+            for mark in element.iter(f'{W}bookmarkStart'):
+                bookmarks.setdefault(mark.get(f'{W}name', ''), child)
+            if element.tag != f'{W}p':
+                continue
+            text = paragraph_text(element)
+            position = Position(index, child, text, paragraph_style(element))
+            index += 1
+            if len(paragraphs) < count:
+                paragraphs.append(position)
+            for anchor in [a for a in pending if a in text]:
+                found[anchor] = position
+                pending.remove(anchor)
+            if len(paragraphs) >= count and not pending:
+                break
+    return paragraphs, found, bookmarks
+
+
+def find_anchor(path, anchor):
+    """The Position of the first body paragraph containing `anchor`, or None"""
+    return scan(path, anchors=[anchor])[1].get(anchor)
+
+
+if __name__ == '__main__':
+    # Compare against a full load: python docx_stream_reader.py FILE.docx [ANCHOR]
+    import resource
+    from docx import Document
+    from docx_anchors import find_anchor as find_loaded_anchor
+
+    path = sys.argv[1]
+    anchor = sys.argv[2] if len(sys.argv) > 2 else None
+    start = time.perf_counter()
+    paragraphs, found, _ = scan(path, count=3, anchors=[anchor] if anchor else [])
+    streamed = time.perf_counter() - start
+    streamed_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    for position in paragraphs + list(found.values()):
+        print(f'  #{position.index} ({position.style}): {position.text[:70]}')
+
+    start = time.perf_counter()
+    doc = Document(path)
+    if anchor:
+        find_loaded_anchor(doc, anchor)
+    else:
+        [p.text for p in doc.paragraphs[:3]]
+    loaded = time.perf_counter() - start
+    print(f'scan:                 {streamed * 1000:8.1f} ms, peak RSS {streamed_mb:.0f} MB')
+    print(f'Document() + lookup:  {loaded * 1000:8.1f} ms, '
+          f'peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB')
@@ -0,0 +1,97 @@
+"""Build whole tables in one pass instead of assigning `.cells[i].text`.
+
+`table.rows[i].cells[j].text = ...` re-walks the row XML and allocates proxy
+objects on every access, and `table.rows[i]` rebuilds the row list each time,
+so filling a table that way slows down quadratically with its length.
+`table_from_rows` serializes the rows of an iterable straight to table XML,
+parses it once and appends the finished table to the document.
+
+    table_from_rows(doc, [('Tier', 'Monthly Price'), ('Bronze', 'UGX 1,476,300')],
+                    style='Light Grid Accent 1')
+"""
+from itertools import chain
+from xml.sax.saxutils import escape
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.table import Table
+
+ROWS_PER_CHUNK = 256
+
+
+def run_xml(text, bold=False):
+    """`w:r` markup for `text`, with line breaks as `w:br`"""
+    props = '<w:rPr><w:b/></w:rPr>' if bold else ''
+    parts = []
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            parts.append('<w:br/>')
+        if line:
+            parts.append(f'<w:t xml:space="preserve">{escape(line)}</w:t>')
+    return f"<w:r>{props}{''.join(parts)}</w:r>"
+
+
+def table_xml(rows, width, style_id=None, namespaces=''):
+    """Yield the markup of a table, one row at a time
+
+    `width` is the block width in twips, split evenly between the columns
+    like `doc.add_table` does. The first row sets the column count.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return
+    cols = len(first)
+    col_width = width // cols
+    style_xml = f'<w:tblStyle w:val="{style_id}"/>' if style_id else ''
+    yield (
+        f'<w:tbl{namespaces}><w:tblPr>{style_xml}<w:tblW w:type="auto" w:w="0"/>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+        'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr><w:tblGrid>'
+        + f'<w:gridCol w:w="{col_width}"/>' * cols + '</w:tblGrid>'
+    )
+    cell_open = f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col_width}"/></w:tcPr><w:p>'
+    for row in chain([first], rows):
+        cells = ''.join(
+            f"{cell_open}{run_xml(str(value)) if value not in (None, '') else ''}</w:p></w:tc>"
+            for value in row
+        )
+        yield f'<w:tr>{cells}</w:tr>'
+    yield '</w:tbl>'
+
+
+def table_element(doc, rows, style=None, attach=None):
+    """Return a `w:tbl` built from an iterable of row tuples, or None if empty
+
+    lxml slows down quadratically when one large parsed subtree is moved into
+    another document, so rows are parsed in chunks of ROWS_PER_CHUNK and
+    appended one chunk at a time. Pass `attach` to place the empty table in
+    the document first; otherwise the table is returned detached.
+    """
+    style_id = doc.part.get_style_id(style, WD_STYLE_TYPE.TABLE) if style is not None else None
+    namespaces = ' ' + nsdecls('w')
+    markup = table_xml(rows, doc._block_width.twips, style_id, namespaces)
+    head = next(markup, None)
+    if head is None:
+        return None
+    tbl = parse_xml(head + '</w:tbl>')
+    if attach is not None:
+        attach(tbl)
+
+    chunk = []
+    for xml in markup:
+        if xml != '</w:tbl>':
+            chunk.append(xml)
+        if chunk and (len(chunk) == ROWS_PER_CHUNK or xml == '</w:tbl>'):
+            tbl.extend(parse_xml(f"<w:tbl{namespaces}>{''.join(chunk)}</w:tbl>"))
+            chunk = []
+    return tbl
+
+
+def table_from_rows(doc, rows, style=None):
+    """Append a table with one row per tuple in `rows` and return it"""
+    tbl = table_element(doc, rows, style, attach=doc.element.body._insert_tbl)
+    if tbl is None:
+        return None
+    return Table(tbl, doc._body)
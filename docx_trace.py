@@ -0,0 +1,167 @@
+"""Named timing spans for the generators, written as a Chrome trace.
+
+Tracing is off unless IHM_TRACE is set, and then every span records its
+elapsed time, the Python memory blocks it left allocated (the net change in
+sys.getallocatedblocks(), so memory allocated and freed inside the span does
+not show) and the number of XML elements it added to the document body. At exit the spans are
+written as Chrome trace JSON (chrome://tracing, ui.perfetto.dev) to the path
+in IHM_TRACE, or to <script>.trace.json when it is set to 1.
+
+Counting elements walks the whole body, so that time is kept out of
+`elapsed_ms`, including the counting done by spans nested inside. `dur` in the
+trace is still wall time so nested spans line up in the viewer.
+
+IHM_TRACE_MALLOC=1 also runs tracemalloc, which tracks actual allocations, and adds
+`traced_bytes` (net bytes the span left allocated) and `peak_bytes` (the most
+it held above its starting point at any moment) to each span. Only Python
+allocations are seen, not lxml's own XML nodes. tracemalloc slows
+allocation-heavy code several times over, so leave it off when timing.
+
+The generators are flat scripts, so top-level parts are marked with
+`section()`, which closes the previous one; `span()` nests inside them:
+
+    trace.section('Executive Summary', doc)
+    ...
+    trace.section(None)
+    with trace.span('Save', doc):
+        save_output(doc, OUTPUT, build_key)
+
+    IHM_TRACE=trace.json python create_action_plan.py --force
+"""
+import atexit
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+TRACE = os.environ.get('IHM_TRACE', '')
+
+_events = []
+_open_section = None
+_open_spans = []
+# Microseconds spent counting elements and memory, left out of the elapsed times
+_overhead_us = 0.0
+
+
+def enabled():
+    return TRACE not in ('', '0')
+
+
+TRACE_MALLOC = enabled() and os.environ.get('IHM_TRACE_MALLOC', '') not in ('', '0')
+if TRACE_MALLOC:
+    tracemalloc.start()
+
+
+def _fold_peak():
+    # tracemalloc keeps one peak for the process; hand it to every open span before resetting it
+    peak = tracemalloc.get_traced_memory()[1]
+    for open_span in _open_spans:
+        open_span.peak = max(open_span.peak, peak)
+    tracemalloc.reset_peak()
+
+
+def _element_count(doc):
+    return sum(1 for _ in doc.element.body.iter()) if doc is not None else 0
+
+
+def _now_us():
+    return time.perf_counter_ns() / 1000
+
+
+class _Span:
+    def __init__(self, name, doc, category):
+        global _overhead_us
+        begin = _now_us()
+        self.name, self.doc, self.category = name, doc, category
+        self.elements = _element_count(doc)
+        if TRACE_MALLOC:
+            _fold_peak()
+            self.traced = self.peak = tracemalloc.get_traced_memory()[0]
+            _open_spans.append(self)
+        self.blocks = sys.getallocatedblocks()
+        # The clock starts once the bookkeeping above is done
+        self.start = _now_us()
+        _overhead_us += self.start - begin
+        self.overhead = _overhead_us
+
+    def close(self):
+        global _overhead_us
+        end = _now_us()
+        blocks = sys.getallocatedblocks()
+        # Leave out what spans opened and closed inside this one spent counting
+        elapsed = end - self.start - (_overhead_us - self.overhead)
+        args = {
+            'elapsed_ms': round(elapsed / 1000, 3),
+            'retained_blocks': blocks - self.blocks,
+            'elements_added': _element_count(self.doc) - self.elements,
+        }
+        if TRACE_MALLOC:
+            _fold_peak()
+            _open_spans.remove(self)
+            args['traced_bytes'] = tracemalloc.get_traced_memory()[0] - self.traced
+            args['peak_bytes'] = self.peak - self.traced
+        _events.append({
+            'name': self.name, 'cat': self.category, 'ph': 'X', 'pid': os.getpid(), 'tid': 1,
+            'ts': self.start, 'dur': end - self.start, 'args': args,
+        })
+        # Counter track so the viewer plots memory alongside the spans
+        _events.append({'name': 'live blocks', 'ph': 'C', 'pid': os.getpid(), 'tid': 1,
+                        'ts': end, 'args': {'blocks': blocks}})
+        _overhead_us += _now_us() - end
+
+
+def span(name, doc=None):
+    """Context manager timing `name`; a no-op unless tracing is enabled"""
+    if not enabled():
+        return nullcontext()
+    return _span(name, doc)
+
+
+@contextmanager
+def _span(name, doc):
+    current = _Span(name, doc, 'span')
+    try:
+        yield
+    finally:
+        current.close()
+
+
+def section(name, doc=None):
+    """Close the open top-level section and, unless `name` is None, start a new one"""
+    global _open_section
+    if not enabled():
+        return
+    if _open_section is not None:
+        _open_section.close()
+        _open_section = None
+    if name is not None:
+        _open_section = _Span(name, doc, 'section')
+
+
+def trace_path():
+    if TRACE == '1':
+        return os.path.splitext(os.path.basename(sys.argv[0] or 'trace'))[0] + '.trace.json'
+    return TRACE
+
+
+def write_trace(path=None):
+    section(None)
+    if not _events:
+        return
+    path = path or trace_path()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': sorted(_events, key=lambda e: e['ts']), 'displayTimeUnit': 'ms'}, f)
+    spans = [e for e in _events if e['ph'] == 'X']
+    for e in sorted(spans, key=lambda e: e['ts']):
+        args = e['args']
+        traced = f" {args['traced_bytes'] / 1024:>+10,.0f} KiB traced {args['peak_bytes'] / 1024:>10,.0f} KiB peak" \
+            if TRACE_MALLOC else ''
+        print(f"  {e['name'][:32]:<32} {args['elapsed_ms']:>9.1f} ms {args['retained_blocks']:>+10,} blocks retained "
+              f"{args['elements_added']:>8,} elements{traced}", file=sys.stderr)
+    print(f'[OK] Trace written to {path}', file=sys.stderr)
+
+
+if enabled():
+    atexit.register(write_trace)
@@ -1,8 +1,6 @@
-import os
-import time
+import sys
 
-# Wait for file to be released
-time.sleep(2)
+from docx_finalize import finalize
 
 # Replace original with updated
 original = 'Client Outreach Plan - Western Uganda (10 First Customers).docx'
@@ -10,15 +8,15 @@ updated = 'Client Outreach Plan - Western Uganda (10 First Customers)_UPDATED.do
 backup = 'Client Outreach Plan - Western Uganda (10 First Customers)_ORIGINAL_BACKUP.docx'
 
 try:
-    # Backup original
-    if os.path.exists(original):
-        os.rename(original, backup)
-    
-    # Replace with updated
-    os.rename(updated, original)
-    
+    # Waits for Word to release the files, then swaps atomically
+    finalize(updated, original, backup)
+
     print(f"Updated document saved as: {original}")
     print(f"Original backed up as: {backup}")
-except Exception as e:
+except TimeoutError as e:
     print(f"Error: {e}")
     print("Please close the document and try again")
+    sys.exit(1)
+except OSError as e:
+    print(f"Error: {e}")
+    sys.exit(1)
@@ -0,0 +1,223 @@
+"""Pricing, cost, break-even and revenue figures for the action plan.
+
+Every UGX amount in the financial section of create_action_plan.py is
+derived here from a handful of parameters (USD prices converted at
+USD_TO_UGX, COGS and fixed cost lines, the customer ramp), so the tables and
+the prose that quotes them cannot drift apart.
+
+`simulate` runs vectorized Monte Carlo scenarios over the uncertain inputs
+(customers won each month, churn, cost overruns, the exchange rate for
+USD-billed services) and `scenario_rows` turns the percentiles into a table.
+100,000 scenarios take well under a second.
+
+    model = FinancialModel()
+    table_from_rows(doc, model.pricing_rows(), style='Light Grid Accent 1')
+    table_from_rows(doc, scenario_rows(model.simulate()), style='Light Grid Accent 1')
+"""
+import math
+import sys
+import time
+
+import numpy as np
+
+USD_TO_UGX = 3700
+
+# (tier, monthly price in USD, target customer)
+TIERS = [
+    ('Bronze', 399, 'Small clinics, NGOs'),
+    ('Silver', 799, 'Hospitals, district programs'),
+    ('Gold', 1499, 'Multi-facility, regional programs'),
+]
+PROJECTION_TIER = 'Silver'
+SETUP_FEE_USD = (2000, 5000)
+
+# (cost line, monthly USD per customer, billed in USD)
+COGS = [
+    ('n8n Cloud Workspace (advanced)', 50, True),
+    ('OpenAI API usage (1000+ messages/month)', 25, True),
+    ('Google Workspace/Sheets (shared)', 10, True),
+    ('WhatsApp Business API (per customer)', 40, True),
+    ('Support & Onboarding (30 min/month)', 150, False),
+]
+FIXED_COSTS = [
+    ('Founder salary/living expenses', 3000),
+    ('Marketing & content', 1200),
+    ('Tools/infrastructure', 800),
+]
+
+# Cumulative paying customers (low, high) at the end of each month
+CUSTOMER_RAMP = [
+    ('Month 1 (Days 1-30)', 0, 0),
+    ('Month 2 (Days 31-60)', 3, 5),
+    ('Month 3 (Days 61-90)', 12, 18),
+    ('Month 4', 18, 25),
+    ('Month 5', 25, 35),
+    ('Month 6', 35, 45),
+]
+
+# Monte Carlo spreads: monthly churn, cost overrun and exchange rate drift
+CHURN_RANGE = (0.0, 0.04)
+COST_OVERRUN_RANGE = (0.9, 1.25)
+FX_SIGMA = 0.05
+SCENARIOS = 100000
+SEED = 2024
+
+
+def ugx(amount, digits=0):
+    return f'UGX {round(amount, digits):,.0f}'
+
+
+def ugx_range(low, high):
+    return ugx(low) if round(low) == round(high) else f'{ugx(low)}-{round(high):,}'
+
+
+def count_range(low, high):
+    return f'{low:,}' if low == high else f'{low:,}-{high:,}'
+
+
+class FinancialModel:
+    """Deterministic figures for the plan, in UGX"""
+
+    def __init__(self, fx=USD_TO_UGX, tier=PROJECTION_TIER):
+        self.fx = fx
+        self.prices = {name: usd * fx for name, usd, _ in TIERS}
+        self.price = self.prices[tier]
+        self.setup_fee = SETUP_FEE_USD[0] * fx
+        self.setup_fee_range = tuple(fee * fx for fee in SETUP_FEE_USD)
+        self.cogs = sum(usd for _, usd, _ in COGS) * fx
+        self.contribution = self.price - self.cogs
+        self.fixed_costs = sum(usd for _, usd in FIXED_COSTS) * fx
+
+    @property
+    def gross_margin(self):
+        return self.contribution / self.price
+
+    @property
+    def break_even_point(self):
+        """Fractional number of customers whose contribution covers fixed costs"""
+        return self.fixed_costs / self.contribution
+
+    @property
+    def break_even_customers(self):
+        return math.ceil(self.break_even_point)
+
+    def pricing_rows(self):
+        rows = [('Tier', 'Monthly Price', 'Target Customer', 'Annual Value')]
+        for name, usd, target in TIERS:
+            rows.append((name, ugx(usd * self.fx), target, ugx(usd * self.fx * 12)))
+        return rows
+
+    def cost_rows(self):
+        rows = [('Cost Category', 'Monthly Cost')]
+        rows.extend((name, ugx(usd * self.fx)) for name, usd, _ in COGS)
+        rows.append(('COGS Total', ugx(self.cogs)))
+        return rows
+
+    def fixed_cost_lines(self):
+        return [(name, usd * self.fx) for name, usd in FIXED_COSTS]
+
+    def ramp(self):
+        """(month, low, high, new low, new high) from the cumulative ramp"""
+        previous = (0, 0)
+        months = []
+        for month, low, high in CUSTOMER_RAMP:
+            months.append((month, low, high, low - previous[0], high - previous[1]))
+            previous = (low, high)
+        return months
+
+    def revenue_rows(self):
+        rows = [('Month', 'Customers', f'MRR (Avg {ugx(self.price)})', 'Setup Fee Revenue')]
+        for month, low, high, new_low, new_high in self.ramp():
+            rows.append((
+                month,
+                count_range(low, high),
+                ugx_range(low * self.price, high * self.price),
+                ugx_range(new_low * self.setup_fee, new_high * self.setup_fee),
+            ))
+        return rows
+
+    def total_revenue(self):
+        """(low, high) MRR plus setup fees over the whole ramp"""
+        months = self.ramp()
+        low = sum(m[1] * self.price + m[3] * self.setup_fee for m in months)
+        high = sum(m[2] * self.price + m[4] * self.setup_fee for m in months)
+        return low, high
+
+    def final_customers(self):
+        return CUSTOMER_RAMP[-1][1:]
+
+    def final_mrr(self):
+        low, high = self.final_customers()
+        return low * self.price, high * self.price
+
+    def simulate(self, scenarios=SCENARIOS, seed=SEED):
+        """Monte Carlo outcomes of the ramp, one array entry per scenario"""
+        rng = np.random.default_rng(seed)
+        months = self.ramp()
+        new_low = np.array([m[3] for m in months])
+        new_high = np.array([m[4] for m in months])
+
+        new = rng.integers(new_low, new_high + 1, size=(scenarios, len(months)))
+        churn = rng.uniform(*CHURN_RANGE, size=scenarios)
+        overrun = rng.uniform(*COST_OVERRUN_RANGE, size=scenarios)
+        fx = self.fx * rng.lognormal(0.0, FX_SIGMA, size=scenarios)
+
+        # Customers lost to churn each month, then this month's wins
+        customers = np.empty(new.shape)
+        active = np.zeros(scenarios)
+        for month in range(len(months)):
+            active = active * (1 - churn) + new[:, month]
+            customers[:, month] = active
+
+        usd_cogs = sum(usd for _, usd, billed_usd in COGS if billed_usd)
+        local_cogs = sum(usd for _, usd, billed_usd in COGS if not billed_usd) * self.fx
+        cogs = (usd_cogs * fx + local_cogs) * overrun
+        contribution = self.price - cogs
+        fixed = self.fixed_costs * overrun
+
+        mrr = customers * self.price
+        profit = customers * contribution[:, None] - fixed[:, None]
+        profitable = profit >= 0
+        break_even_month = np.where(profitable.any(axis=1), profitable.argmax(axis=1) + 1, 0)
+        return {
+            'final_customers': customers[:, -1],
+            'final_mrr': mrr[:, -1],
+            'total_revenue': mrr.sum(axis=1) + new.sum(axis=1) * self.setup_fee,
+            'break_even_customers': np.ceil(fixed / contribution),
+            'break_even_month': break_even_month,
+        }
+
+
+def percentiles(values, q=(10, 50, 90)):
+    return np.percentile(values, q)
+
+
+def scenario_rows(results):
+    """P10 / P50 / P90 table of the Monte Carlo results"""
+    rows = [('Outcome', 'Pessimistic (P10)', 'Expected (P50)', 'Optimistic (P90)')]
+    customers = percentiles(results['final_customers'])
+    rows.append(('Paying customers by Month 6', *(f'{c:.0f}' for c in customers)))
+    # Simulated amounts are rounded to the nearest UGX 100,000
+    rows.append(('MRR by Month 6', *(ugx(v, -5) for v in percentiles(results['final_mrr']))))
+    rows.append(('Total revenue (6 months)', *(ugx(v, -5) for v in percentiles(results['total_revenue']))))
+    # Fewer customers needed to break even is the optimistic end
+    needed = percentiles(results['break_even_customers'], (90, 50, 10))
+    rows.append(('Customers needed to break even', *(f'{c:.0f}' for c in needed)))
+    return rows
+
+
+def break_even_share(results):
+    """Share of scenarios that are profitable by the end of the ramp"""
+    return float((results['break_even_month'] > 0).mean())
+
+
+if __name__ == '__main__':
+    scenarios = int(sys.argv[1]) if len(sys.argv) > 1 else SCENARIOS
+    model = FinancialModel()
+    print(f'Break-even: {ugx(model.fixed_costs)} / {ugx(model.contribution)} = {model.break_even_point:.1f} customers')
+    start = time.perf_counter()
+    results = model.simulate(scenarios)
+    elapsed = time.perf_counter() - start
+    for row in scenario_rows(results):
+        print(' | '.join(row))
+    print(f'[OK] {scenarios:,} scenarios in {elapsed:.3f}s, {break_even_share(results):.0%} profitable by Month 6')
@@ -0,0 +1,97 @@
+"""Render one tailored outreach pack (.docx) per prospect, across all CPU cores.
+
+Prospect records come from a .json list or a .csv file with the same keys as
+specs/prospects_western.json (name, location, district, type, patients, sites,
+tier, contact_person, title, linkedin, email, whatsapp, why_need, key_pain,
+approach, priority, contact_method, timeline). Without --prospects, those ten
+Western Uganda prospects are used. Prospects are ranked with prospect_scoring;
+--top N renders only the N highest-scoring ones.
+
+Each pack is written as soon as its worker finishes it, so memory stays flat
+no matter how many prospects are in the list.
+
+Usage: python generate_outreach_packs.py [--prospects FILE] [--out DIR] [--jobs N] [--top N]
+"""
+import csv
+import json
+import os
+import re
+import sys
+import time
+from multiprocessing import Pool
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from build_cache import build_date, save_document
+from doc_spec import load_data
+from docx_template import base_document, new_document
+from outreach_sections import add_prospect_section
+from prospect_scoring import rank_prospects
+
+DEFAULT_SOURCE = 'prospects_western'
+DEFAULT_OUT = 'outreach_packs'
+
+
+def load_prospects(path=None):
+    """Read prospect records from .json/.csv, or the Western Uganda list in specs/"""
+    if path is None:
+        return load_data(DEFAULT_SOURCE)
+    if path.endswith('.json'):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def pack_filename(index, prospect):
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', prospect['name']).strip('-')[:60]
+    return f'{index:05d}-{slug}.docx'
+
+
+def render_pack(prospect):
+    """Build the outreach pack document for one prospect"""
+    doc = new_document()
+
+    title = doc.add_heading(f"Outreach Pack - {prospect['name']}", 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subtitle = doc.add_paragraph(f"{prospect['location']} | {prospect.get('district', '')}".rstrip(' |'))
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    date = doc.add_paragraph(f'Prepared: {build_date().strftime("%B %d, %Y")}')
+    date.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    doc.add_paragraph()
+
+    add_prospect_section(doc, prospect)
+    return doc
+
+
+def _render_to_disk(job):
+    index, prospect, out_dir = job
+    path = os.path.join(out_dir, pack_filename(index, prospect))
+    save_document(render_pack(prospect), path)
+    return path
+
+
+def generate_packs(prospects, out_dir=DEFAULT_OUT, jobs=None):
+    """Render every prospect in a process pool, yielding paths as packs land on disk"""
+    os.makedirs(out_dir, exist_ok=True)
+    # Parse the template before forking so every worker starts with it
+    base_document()
+    work = ((i, prospect, out_dir) for i, prospect in enumerate(prospects, start=1))
+    with Pool(processes=jobs) as pool:
+        # Small chunks keep results streaming back while still batching IPC
+        yield from pool.imap_unordered(_render_to_disk, work, chunksize=8)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    source = args[args.index('--prospects') + 1] if '--prospects' in args else None
+    out_dir = args[args.index('--out') + 1] if '--out' in args else DEFAULT_OUT
+    jobs = int(args[args.index('--jobs') + 1]) if '--jobs' in args else None
+    top = int(args[args.index('--top') + 1]) if '--top' in args else None
+
+    prospects = rank_prospects(load_prospects(source), top)
+    start = time.perf_counter()
+    for count, path in enumerate(generate_packs(prospects, out_dir, jobs), start=1):
+        if count % 100 == 0 or count == len(prospects):
+            print(f'{count}/{len(prospects)} packs written (latest: {path})')
+    elapsed = time.perf_counter() - start
+    print(f'[OK] {len(prospects)} outreach packs in {elapsed:.2f}s ({len(prospects) / elapsed:.1f} docs/s)')
@@ -0,0 +1,165 @@
+"""Weekly missed appointment report built from the HealthFlow schema CSVs.
+
+Reads Appointments.csv, Patients.csv and Facilities.csv and, for a one-week
+window, counts per facility the appointments that were scheduled, completed,
+missed (status missed / no-show) and defaulted (still scheduled or pending
+after their date passed). The report uses the same styling as the plan
+generators and lists every missed or defaulted visit per facility.
+
+Appointments are streamed once with the csv module and filtered on the ISO
+date strings, so a 1M-row file takes seconds; patient details are only kept
+for patients that actually appear in the report.
+
+Usage: python missed_appointments_report.py [--week-start YYYY-MM-DD]
+       [--schema DIR] [--out FILE]
+"""
+import csv
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from build_cache import build_date, save_document
+from docx_tables import table_from_rows
+from docx_template import new_document
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'HealthFlow-Mobile', 'schema')
+MISSED_STATUSES = {'missed', 'no-show', 'no_show', 'noshow', 'defaulted'}
+OPEN_STATUSES = {'scheduled', 'pending', 'confirmed'}
+
+
+def _rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        yield {name: i for i, name in enumerate(header)}
+        yield from reader
+
+
+def load_facilities(path):
+    rows = _rows(path)
+    col = next(rows)
+    return {row[col['facility_id']]: row[col['name']] for row in rows}
+
+
+def load_patients(path, wanted):
+    """Name and phone for the patient ids in `wanted`"""
+    rows = _rows(path)
+    col = next(rows)
+    pid, first, last, phone = col['patient_id'], col['first_name'], col['last_name'], col['phone']
+    return {
+        row[pid]: (f'{row[first]} {row[last]}', row[phone])
+        for row in rows if row[pid] in wanted
+    }
+
+
+def scan_appointments(path, week_start, week_end, as_of):
+    """Per-facility status counts and the missed/defaulted visits in the window
+
+    Dates are compared as ISO strings; `week_end` is exclusive.
+    """
+    start, end, cutoff = week_start.isoformat(), week_end.isoformat(), as_of.isoformat()
+    counts = defaultdict(Counter)
+    missed = defaultdict(list)
+
+    rows = _rows(path)
+    col = next(rows)
+    facility, patient, kind = col['facility_id'], col['patient_id'], col['appointment_type']
+    date, status = col['scheduled_date'], col['status']
+    for row in rows:
+        scheduled = row[date]
+        if not start <= scheduled < end:
+            continue
+        state = row[status].lower()
+        tally = counts[row[facility]]
+        tally['scheduled'] += 1
+        if state == 'completed':
+            tally['completed'] += 1
+        elif state in MISSED_STATUSES:
+            tally['missed'] += 1
+            missed[row[facility]].append((row[patient], row[kind], scheduled, 'Missed'))
+        elif state in OPEN_STATUSES and scheduled < cutoff:
+            tally['defaulted'] += 1
+            missed[row[facility]].append((row[patient], row[kind], scheduled, 'Defaulted'))
+    return counts, missed
+
+
+def render_report(week_start, week_end, as_of, facilities, patients, counts, missed):
+    doc = new_document()
+
+    title = doc.add_heading('Weekly Missed Appointment Report', 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    last_day = week_end - timedelta(days=1)
+    subtitle = doc.add_paragraph(f'Week of {week_start:%B %d, %Y} - {last_day:%B %d, %Y}')
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    date = doc.add_paragraph(f'Prepared: {build_date().strftime("%B %d, %Y")}')
+    date.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    doc.add_paragraph()
+
+    doc.add_heading('Summary by Facility', 1)
+    total = sum(counts.values(), Counter())
+    summary = doc.add_paragraph()
+    summary.add_run('Appointments this week: ').bold = True
+    summary.add_run(f"{total['scheduled']:,}\n")
+    summary.add_run('Missed: ').bold = True
+    summary.add_run(f"{total['missed']:,}\n")
+    # as_of is exclusive, so the last day a defaulted visit can fall on is the day before
+    last_due = as_of - timedelta(days=1)
+    summary.add_run(f'Defaulted (due by {last_due:%B %d}, still open): ').bold = True
+    summary.add_run(f"{total['defaulted']:,}")
+
+    summary_rows = [('Facility', 'Scheduled', 'Completed', 'Missed', 'Defaulted', 'Miss Rate')]
+    for facility_id in sorted(counts, key=lambda f: -(counts[f]['missed'] + counts[f]['defaulted'])):
+        tally = counts[facility_id]
+        lost = tally['missed'] + tally['defaulted']
+        summary_rows.append((
+            facilities.get(facility_id, facility_id),
+            f"{tally['scheduled']:,}",
+            f"{tally['completed']:,}",
+            f"{tally['missed']:,}",
+            f"{tally['defaulted']:,}",
+            f"{lost / tally['scheduled']:.1%}",
+        ))
+    table_from_rows(doc, summary_rows, style='Light Grid Accent 1')
+
+    for facility_id in sorted(missed, key=lambda f: facilities.get(f, f)):
+        doc.add_page_break()
+        doc.add_heading(f'{facilities.get(facility_id, facility_id)} - Follow-up List', 1)
+        visits = sorted(missed[facility_id], key=lambda v: v[2])
+        doc.add_paragraph(f'{len(visits):,} patient{"" if len(visits) == 1 else "s"} to contact this week',
+                          style='List Bullet')
+        follow_up = [('Patient', 'Phone', 'Appointment Type', 'Scheduled', 'Status', 'Days Overdue')]
+        for patient_id, kind, scheduled, status in visits:
+            name, phone = patients.get(patient_id, (patient_id, ''))
+            overdue = (as_of - datetime.strptime(scheduled, '%Y-%m-%d').date()).days
+            follow_up.append((name, phone, kind, scheduled, status, str(overdue)))
+        table_from_rows(doc, follow_up, style='Light Grid Accent 1')
+    return doc
+
+
+def build_report(week_start, schema_dir=SCHEMA_DIR):
+    week_end = week_start + timedelta(days=7)
+    as_of = min(week_end, build_date().date())
+    counts, missed = scan_appointments(os.path.join(schema_dir, 'Appointments.csv'), week_start, week_end, as_of)
+    wanted = {visit[0] for visits in missed.values() for visit in visits}
+    patients = load_patients(os.path.join(schema_dir, 'Patients.csv'), wanted)
+    facilities = load_facilities(os.path.join(schema_dir, 'Facilities.csv'))
+    return render_report(week_start, week_end, as_of, facilities, patients, counts, missed)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if '--week-start' in args:
+        week_start = datetime.strptime(args[args.index('--week-start') + 1], '%Y-%m-%d').date()
+    else:
+        today = build_date().date()
+        week_start = today - timedelta(days=today.weekday())
+    schema_dir = args[args.index('--schema') + 1] if '--schema' in args else SCHEMA_DIR
+    output = args[args.index('--out') + 1] if '--out' in args else f'Missed Appointments - Week of {week_start}.docx'
+
+    start = time.perf_counter()
+    doc = build_report(week_start, schema_dir)
+    save_document(doc, output)
+    print(f'[OK] Missed appointment report saved as {output} ({time.perf_counter() - start:.2f}s)')
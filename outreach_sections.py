@@ -0,0 +1,61 @@
+"""Per-prospect section shared by create_western_uganda_plan.py and the outreach packs"""
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx_tables import table_from_rows
+
+
+def add_prospect_section(doc, prospect):
+    """Add the profile, info table and outreach plan for one prospect"""
+    # Header
+    doc.add_heading(f"PROSPECT #{prospect['rank']}: {prospect['name']}", 1)
+    
+    # Quick Info Table
+    info_rows = [
+        ('Location', prospect['location']),
+        ('District', prospect['district']),
+        ('Organization Type', prospect['type']),
+        ('Contact Person', prospect['contact_person']),
+        ('Title', prospect['title']),
+        ('Priority Level', prospect['priority_level']),
+    ]
+    table_from_rows(doc, info_rows, style='Light Grid Accent 1')
+    
+    doc.add_paragraph()
+    
+    # Why They Need Our Solution
+    doc.add_heading('Why They Need Our Solution', 2)
+    p = doc.add_paragraph(prospect['why_need'])
+    p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+    p.paragraph_format.line_spacing = 1.15
+    
+    # Key Pain Points
+    doc.add_heading('Key Pain Points', 2)
+    p = doc.add_paragraph(prospect['key_pain'])
+    p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+    p.paragraph_format.line_spacing = 1.15
+    
+    # Outreach Strategy
+    doc.add_heading('Outreach Strategy & Talking Points', 2)
+    p = doc.add_paragraph(prospect['approach'])
+    p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+    p.paragraph_format.line_spacing = 1.15
+    
+    # Contact Information
+    doc.add_heading('Contact Methods & Channels', 2)
+    contact_info = doc.add_paragraph()
+    contact_info.add_run('Primary Channel: ').bold = True
+    contact_info.add_run(f"{prospect['contact_method']}\n\n")
+    contact_info.add_run('LinkedIn: ').bold = True
+    contact_info.add_run(f"{prospect['linkedin']}\n")
+    contact_info.add_run('WhatsApp: ').bold = True
+    contact_info.add_run(f"{prospect['whatsapp']}\n")
+    contact_info.add_run('Email: ').bold = True
+    contact_info.add_run(f"{prospect['email']}\n")
+    
+    # Timeline
+    doc.add_heading('Outreach Timeline', 2)
+    doc.add_paragraph(prospect['timeline'])
+    
+    # Priority & Notes
+    doc.add_heading('Priority Assessment', 2)
+    priority_notes = doc.add_paragraph()
+    priority_notes.add_run(prospect['priority'])
@@ -0,0 +1,185 @@
+"""Numeric prospect priority and top-k ranking for the outreach generators.
+
+A prospect's score (0-100) is a weighted sum of four normalized attributes:
+
+    patient load   log-scaled `patients`, or `sites` x PATIENTS_PER_SITE
+                   when only the number of facilities is known
+    facility type  TYPE_WEIGHTS, matched against the `type` text
+    tier fit       monthly price of the recommended `tier` relative to Gold
+    prevalence     `prevalence` if given, else PREVALENCE for the district /
+                   location, relative to the highest value in the table
+
+Scores for the whole candidate list are computed as numpy arrays and the top
+N are picked with a heap (heapq.nlargest), so ranking tens of thousands of
+facilities never sorts the full list. An attribute a prospect does not
+give (no patients or sites, an unknown tier or place) takes the median of
+the other prospects rather than counting as zero.
+
+`rank_prospects` returns the top N in score order as copies with `score` and
+`priority_level` filled in. `rank` is the position in that order, and
+`priority` is the computed level followed by the written reason (any level
+the reason was written with is dropped), so the heading number, the Priority
+Level cell and the priority text all come from the score:
+
+    for prospect in rank_prospects(prospects, top=10):
+        add_prospect_section(doc, prospect)
+"""
+import heapq
+import math
+import sys
+import time
+
+import numpy as np
+from financial_model import TIERS
+
+WEIGHTS = {'load': 35, 'type': 20, 'tier': 25, 'prevalence': 20}
+PATIENTS_PER_SITE = 250
+FULL_LOAD_PATIENTS = 5000
+
+# First matching keyword wins, so more specific phrases come first
+TYPE_WEIGHTS = [
+    ('regional referral', 1.0),
+    ('regional', 0.9),
+    ('district program', 0.9),
+    ('ministry', 0.8),
+    ('government', 0.8),
+    ('multi-clinic', 0.85),
+    ('hospital', 0.8),
+    ('ngo', 0.7),
+    ('private', 0.65),
+    ('specialized', 0.6),
+    ('academic', 0.55),
+    ('teaching', 0.55),
+    ('humanitarian', 0.5),
+]
+DEFAULT_TYPE_WEIGHT = 0.5
+
+# Approximate adult HIV prevalence (%), used only to compare prospects
+PREVALENCE = {
+    'Mbarara': 7.9, 'Isingiro': 7.9, 'Ntungamo': 7.9,
+    'Fort Portal': 7.4, 'Kabarole': 7.4, 'Kyenjojo': 7.4, 'Bundibugyo': 7.4,
+    'Kabale': 3.6, 'Kisoro': 3.6, 'Kanungu': 3.6, 'Rukungiri': 3.6,
+    'Kampala': 6.9, 'Uganda': 5.5,
+    'South Africa': 17.0, 'Zimbabwe': 11.0, 'Mozambique': 11.5,
+    'Zambia': 11.0, 'Rwanda': 2.6,
+}
+
+PRIORITY_LEVELS = [(80, 'HIGHEST'), (65, 'HIGH'), (55, 'MEDIUM-HIGH'), (45, 'MEDIUM')]
+LOWEST_PRIORITY = 'MEDIUM-LOW'
+
+_TIER_FIT = {name: usd / max(price for _, price, _ in TIERS) for name, usd, _ in TIERS}
+
+
+def _number(value):
+    """float(value), or NaN when it is missing or not a number"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _fill_unknown(values):
+    # An unknown attribute scores the median of the known ones (or mid-scale), never zero
+    values = np.asarray(values, dtype=float)
+    known = values[~np.isnan(values)]
+    return np.where(np.isnan(values), np.median(known) if known.size else 0.5, values)
+
+
+def type_weight(org_type):
+    org_type = (org_type or '').lower()
+    for keyword, weight in TYPE_WEIGHTS:
+        if keyword in org_type:
+            return weight
+    return DEFAULT_TYPE_WEIGHT
+
+
+def prevalence_of(prospect):
+    if prospect.get('prevalence') not in (None, ''):
+        return _number(prospect['prevalence'])
+    text = f"{prospect.get('district', '')} {prospect.get('location', '')}"
+    found = [(text.find(name), value) for name, value in PREVALENCE.items() if name in text]
+    return min(found)[1] if found else math.nan
+
+
+def score_arrays(patients, type_weights, tier_fit, prevalence):
+    """Vectorized 0-100 scores from per-prospect attribute arrays; NaN marks an unknown value"""
+    load = np.clip(np.log10(np.maximum(patients, 1)) / math.log10(FULL_LOAD_PATIENTS), 0, 1)
+    return (
+        WEIGHTS['load'] * _fill_unknown(load)
+        + WEIGHTS['type'] * np.asarray(type_weights)
+        + WEIGHTS['tier'] * _fill_unknown(tier_fit)
+        + WEIGHTS['prevalence'] * _fill_unknown(np.asarray(prevalence, dtype=float) / max(PREVALENCE.values()))
+    )
+
+
+def patient_load(prospect):
+    patients = _number(prospect.get('patients'))
+    if math.isnan(patients):
+        return _number(prospect.get('sites')) * PATIENTS_PER_SITE
+    return patients
+
+
+def score_prospects(prospects):
+    return score_arrays(
+        np.array([patient_load(p) for p in prospects], dtype=float),
+        [type_weight(p.get('type')) for p in prospects],
+        [_TIER_FIT.get(p.get('tier'), math.nan) for p in prospects],
+        [prevalence_of(p) for p in prospects],
+    )
+
+
+def top_k(scores, k):
+    """Indices of the k highest scores, best first; ties keep input order"""
+    scores = scores.tolist()
+    return heapq.nlargest(k, range(len(scores)), key=lambda i: (scores[i], -i))
+
+
+def priority_level(score):
+    for threshold, level in PRIORITY_LEVELS:
+        if score >= threshold:
+            return level
+    return LOWEST_PRIORITY
+
+
+def _written_reason(priority):
+    """The reason in a written "LEVEL - reason" priority, without the level"""
+    text = (priority or '').strip()
+    for level in sorted([name for _, name in PRIORITY_LEVELS] + [LOWEST_PRIORITY], key=len, reverse=True):
+        if text.upper().startswith(level):
+            return text[len(level):].lstrip(' -:').strip()
+    return text
+
+
+def rank_prospects(prospects, top=None):
+    """The `top` highest-scoring prospects (all by default) with score, rank and priority level"""
+    prospects = list(prospects)
+    scores = score_prospects(prospects)
+    ranked = []
+    for position, i in enumerate(top_k(scores, top or len(prospects)), start=1):
+        prospect = dict(prospects[i])
+        level = priority_level(scores[i])
+        reason = _written_reason(prospect.get('priority'))
+        prospect.update(score=round(float(scores[i]), 1), priority_level=level, rank=str(position),
+                        priority=f'{level} - {reason}' if reason else level)
+        ranked.append(prospect)
+    return ranked
+
+
+if __name__ == '__main__':
+    # Demo: python prospect_scoring.py [candidates] [top] ranks synthetic facilities
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    rng = np.random.default_rng(11)
+    types = [keyword.title() for keyword, _ in TYPE_WEIGHTS]
+    places = list(PREVALENCE)
+    candidates = [
+        {'name': f'Facility {i}', 'type': types[i % len(types)], 'location': places[i % len(places)],
+         'patients': int(rng.lognormal(6, 1)), 'tier': TIERS[i % len(TIERS)][0]}
+        for i in range(size)
+    ]
+    start = time.perf_counter()
+    ranked = rank_prospects(candidates, top)
+    elapsed = time.perf_counter() - start
+    for prospect in ranked:
+        print(f"#{prospect['rank']:<3} {prospect['score']:5.1f} {prospect['priority_level']:<12} {prospect['name']}")
+    print(f'[OK] top {top} of {size:,} candidates in {elapsed * 1000:.0f}ms')
@@ -0,0 +1,212 @@
+"""Resident HTTP render service that returns .docx bytes.
+
+Spawning a create_* script per document pays interpreter startup, the
+python-docx/lxml import and template parsing every time. This server keeps
+a pool of worker processes with all of that done up front (the prepared
+template from docx_template included); an asyncio front end parses requests
+and hands each render to a free worker.
+
+    POST /render   JSON spec in, .docx out
+    GET  /health   {"status": "ok", "workers": N}
+
+Specs are picked by `kind`:
+
+    {"kind": "prospect", "prospect": {...}}              outreach pack, as
+        generate_outreach_packs renders it (the record is scored if it has
+        no priority_level yet)
+    {"kind": "missed_appointments", "week_start": "2024-01-08"}
+    {"kind": "document", "title": "...", "subtitle": "...", "blocks": [
+        {"heading": "Summary", "level": 1},
+        {"paragraph": "Text", "style": "List Bullet"},
+        {"runs": [["Bold: ", true], ["plain", false]]},
+        {"table": [["Tier", "Price"], ["Silver", "UGX 2,956,300"]], "style": "Light Grid Accent 1"},
+        {"page_break": true},
+        {"include": "integrated_features"}]}       specs/*.json, see doc_spec
+
+An optional "filename" sets the Content-Disposition name; characters other
+than letters, digits, spaces and ._()- become underscores. From n8n (or curl):
+
+    curl --data @spec.json http://127.0.0.1:8765/render -o pack.docx
+
+Usage: python render_server.py [--host HOST] [--port PORT] [--jobs N]
+"""
+import asyncio
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from build_cache import document_bytes
+from doc_spec import build_elements, compile_blocks
+from docx_splice import splice_before
+from docx_template import base_document, new_document
+
+DOCX_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+MAX_BODY = 8 << 20
+MAX_FILENAME = 100
+UNSAFE_FILENAME = re.compile(r'[^A-Za-z0-9 ._()-]+')
+HOST, PORT = '127.0.0.1', 8765
+
+
+def build_document(spec):
+    """A document from a title and a list of block dicts"""
+    doc = new_document()
+    if spec.get('title'):
+        doc.add_heading(spec['title'], 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    if spec.get('subtitle'):
+        doc.add_paragraph(spec['subtitle']).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    # Same block vocabulary as specs/*.json, including {"include": name}
+    splice_before(doc.element.body.sectPr, build_elements(doc, compile_blocks(spec.get('blocks', []))))
+    return doc
+
+
+def render_prospect(spec):
+    from generate_outreach_packs import render_pack
+    from prospect_scoring import rank_prospects
+
+    prospect = spec['prospect']
+    if not isinstance(prospect, dict):
+        raise TypeError('"prospect" must be a JSON object')
+    if 'priority_level' not in prospect:
+        prospect = rank_prospects([prospect])[0]
+    return render_pack(prospect)
+
+
+def render_missed_appointments(spec):
+    from missed_appointments_report import SCHEMA_DIR, build_report
+
+    # Always the server's own schema folder; a request never picks paths on disk
+    return build_report(date.fromisoformat(spec['week_start']), SCHEMA_DIR)
+
+
+RENDERERS = {
+    'document': build_document,
+    'prospect': render_prospect,
+    'missed_appointments': render_missed_appointments,
+}
+
+
+def render_spec(spec):
+    """Render one spec to .docx bytes (runs in a worker process)"""
+    kind = spec.get('kind', 'document')
+    if kind not in RENDERERS:
+        raise ValueError(f'Unknown kind {kind!r}; expected one of {sorted(RENDERERS)}')
+    return document_bytes(RENDERERS[kind](spec))
+
+
+def attachment_name(spec):
+    """The Content-Disposition filename: safe characters only, always .docx"""
+    name = spec.get('filename')
+    if name is None:
+        name = f"{spec.get('kind', 'document')}.docx"
+    if not isinstance(name, str):
+        raise TypeError('"filename" must be a string')
+    stem = UNSAFE_FILENAME.sub('_', os.path.splitext(os.path.basename(name))[0]).strip(' ._')
+    return f"{stem[:MAX_FILENAME] or 'document'}.docx"
+
+
+def _warm_up():
+    # Import the renderers and parse the template before the first request
+    import generate_outreach_packs, missed_appointments_report, prospect_scoring  # noqa: F401
+    base_document()
+
+
+class RenderServer:
+    def __init__(self, jobs=None):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.jobs, initializer=_warm_up)
+
+    async def _respond(self, writer, status, body, content_type='application/json', headers=()):
+        reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 413: 'Payload Too Large',
+                  500: 'Internal Server Error'}[status]
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode()
+        head = [f'HTTP/1.1 {status} {reason}', f'Content-Type: {content_type}', f'Content-Length: {len(body)}', *headers]
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+    async def _request(self, reader):
+        """(method, path, headers, body) of the next request, or None at end of stream"""
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        method, path, _ = line.decode('latin-1').split(' ', 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length') or 0)
+        if length > MAX_BODY:
+            raise OverflowError(length)
+        body = await reader.readexactly(length) if length else b''
+        return method, path, headers, body
+
+    async def handle(self, reader, writer):
+        # Keep the connection open between requests unless the client closes it
+        try:
+            while True:
+                try:
+                    request = await self._request(reader)
+                except OverflowError:
+                    await self._respond(writer, 413, {'error': f'Body larger than {MAX_BODY} bytes'})
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                await self._dispatch(writer, method, path, body)
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, writer, method, path, body):
+        if method == 'GET' and path == '/health':
+            await self._respond(writer, 200, {'status': 'ok', 'workers': self.jobs})
+            return
+        if method != 'POST' or path != '/render':
+            await self._respond(writer, 404, {'error': f'No route for {method} {path}'})
+            return
+        try:
+            spec = json.loads(body)
+            if not isinstance(spec, dict):
+                raise TypeError('The spec must be a JSON object')
+            filename = attachment_name(spec)
+            data = await asyncio.get_running_loop().run_in_executor(self.pool, render_spec, spec)
+        except (ValueError, KeyError, TypeError) as exc:
+            await self._respond(writer, 400, {'error': f'{type(exc).__name__}: {exc}'})
+            return
+        except Exception as exc:
+            await self._respond(writer, 500, {'error': f'{type(exc).__name__}: {exc}'})
+            return
+        await self._respond(writer, 200, data, DOCX_TYPE, [f'Content-Disposition: attachment; filename="{filename}"'])
+
+    async def serve(self, host=HOST, port=PORT):
+        # Start every worker now rather than on the first requests
+        await asyncio.gather(*(asyncio.get_running_loop().run_in_executor(self.pool, _warm_up)
+                               for _ in range(self.jobs)))
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f'[OK] Render server listening on http://{host}:{port} ({self.jobs} workers)')
+        async with server:
+            await server.serve_forever()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    host = args[args.index('--host') + 1] if '--host' in args else HOST
+    port = int(args[args.index('--port') + 1]) if '--port' in args else PORT
+    jobs = int(args[args.index('--jobs') + 1]) if '--jobs' in args else None
+    server = RenderServer(jobs)
+    try:
+        asyncio.run(server.serve(host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.pool.shutdown(cancel_futures=True)
@@ -0,0 +1,314 @@
+"""Columnar, memory-mapped cache of the HealthFlow schema CSVs.
+
+The first load of a CSV infers a type for every column, converts it to a
+typed numpy array and writes the arrays as .npy files under a `.colcache`
+directory next to the CSV:
+
+    int / float      int64 / float64 (blank cells make an int column float, NaN)
+    ISO dates        datetime64[s] (blank cells are NaT)
+    everything else  dictionary encoded: int32 codes + a vocabulary array
+
+Later loads memory-map those files, so they cost a few file opens no matter
+how large the data is, and every process that maps them shares the same
+pages from the OS cache. The cache is rebuilt when the CSV's size and mtime
+change and its SHA-256 no longer matches. Processes that find the cache
+stale at the same time build it once, under a `.lock` file next to it.
+
+`facility_id` and `patient_id` are always stored as text, even when every
+ID is all digits, and get a hash index (vocabulary dict -> row positions,
+stored as a sorted row order plus per-code offsets):
+
+    appointments = load_table('HealthFlow-Mobile/schema/Appointments.csv')
+    rows = appointments.rows_for('patient_id', 'patient_001')
+    appointments['scheduled_date'][rows]
+"""
+import csv
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from contextlib import contextmanager
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+try:
+    import fcntl
+except ImportError:  # Windows: the rename fallback in _build covers it
+    fcntl = None
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'HealthFlow-Mobile', 'schema')
+TABLES = ('Patients', 'Appointments', 'Vitals', 'PatientCases', 'AIAnalysisRequests')
+INDEXED = ('facility_id', 'patient_id')
+CACHE_VERSION = 2
+CHUNK_ROWS = 500000
+
+INT, FLOAT, DATETIME, STR = 'int', 'float', 'datetime', 'str'
+PATTERNS = {
+    INT: re.compile(r'^[+-]?\d+$'),
+    FLOAT: re.compile(r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$'),
+    DATETIME: re.compile(r'^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2})?)?$'),
+}
+
+
+def _kind_of(value):
+    for kind, pattern in PATTERNS.items():
+        if pattern.match(value):
+            return kind
+    return STR
+
+
+def _widen(current, kind):
+    if current is None or current == kind:
+        return kind
+    if {current, kind} <= {INT, FLOAT}:
+        return FLOAT
+    return STR
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _csv_rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        yield from csv.reader(f)
+
+
+def _infer(path):
+    """Header, row count and column kinds from one pass over the CSV"""
+    rows = _csv_rows(path)
+    header = next(rows)
+    kinds = [None] * len(header)
+    blanks = [False] * len(header)
+    count = 0
+    for row in rows:
+        count += 1
+        for i, value in enumerate(row[:len(header)]):
+            kind = kinds[i]
+            if kind == STR:
+                continue
+            if value == '':
+                blanks[i] = True
+            elif kind is None or not PATTERNS[kind].match(value):
+                # Ints also match the float pattern, so a float column stays float
+                kinds[i] = _widen(kind, _kind_of(value))
+    kinds = [
+        STR if kind is None or name in INDEXED else FLOAT if kind == INT and blank else kind
+        for name, kind, blank in zip(header, kinds, blanks)
+    ]
+    return header, count, kinds
+
+
+def _convert(values, kind, vocab):
+    if kind == INT:
+        return np.asarray(values).astype(np.int64)
+    if kind == FLOAT:
+        return np.asarray([v or 'nan' for v in values]).astype(np.float64)
+    if kind == DATETIME:
+        return np.array([v.replace(' ', 'T') or 'NaT' for v in values], dtype='datetime64[s]')
+    return np.fromiter((vocab.setdefault(v, len(vocab)) for v in values), dtype=np.int32, count=len(values))
+
+
+def _dtype(kind):
+    return {INT: np.int64, FLOAT: np.float64, DATETIME: 'datetime64[s]', STR: np.int32}[kind]
+
+
+def _build(csv_path, cache_dir, sha256):
+    """Convert the CSV into .npy column files in a fresh cache directory"""
+    header, count, kinds = _infer(csv_path)
+    building = cache_dir + f'.building-{os.getpid()}'
+    shutil.rmtree(building, ignore_errors=True)
+    os.makedirs(building)
+
+    arrays = [open_memmap(os.path.join(building, f'{name}.npy'), mode='w+', dtype=_dtype(kind), shape=(count,))
+              for name, kind in zip(header, kinds)]
+    vocabs = [{} for _ in header]
+    rows = _csv_rows(csv_path)
+    next(rows)
+    position = 0
+    while position < count:
+        chunk = [row + [''] * (len(header) - len(row)) for _, row in zip(range(CHUNK_ROWS), rows)]
+        for i, kind in enumerate(kinds):
+            arrays[i][position:position + len(chunk)] = _convert([row[i] for row in chunk], kind, vocabs[i])
+        position += len(chunk)
+
+    indexes = []
+    for name, kind, array, vocab in zip(header, kinds, arrays, vocabs):
+        array.flush()
+        if kind != STR:
+            continue
+        np.save(os.path.join(building, f'{name}.vocab.npy'), np.array(list(vocab) or [''], dtype=str))
+        if name in INDEXED:
+            codes = np.asarray(array)
+            counts = np.bincount(codes, minlength=len(vocab))
+            np.save(os.path.join(building, f'{name}.order.npy'), np.argsort(codes, kind='stable'))
+            np.save(os.path.join(building, f'{name}.offsets.npy'), np.concatenate([[0], np.cumsum(counts)]))
+            indexes.append(name)
+    del arrays
+
+    stat = os.stat(csv_path)
+    meta = {
+        'version': CACHE_VERSION,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': sha256 or _sha256(csv_path),
+        'rows': count,
+        'columns': dict(zip(header, kinds)),
+        'indexes': indexes,
+    }
+    with open(os.path.join(building, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+    # Move the old cache aside first so the swap is a single rename; processes
+    # still mapping the old files keep their (unlinked) copies
+    stale = cache_dir + f'.stale-{os.getpid()}'
+    try:
+        os.rename(cache_dir, stale)
+    except FileNotFoundError:
+        pass
+    try:
+        os.rename(building, cache_dir)
+    except OSError:
+        # Another process without the lock (no fcntl) got there first
+        shutil.rmtree(building, ignore_errors=True)
+        fresh, _ = _fresh_meta(csv_path, cache_dir)
+        if fresh is None:
+            raise
+        meta = fresh
+    shutil.rmtree(stale, ignore_errors=True)
+    return meta
+
+
+@contextmanager
+def _build_lock(cache_dir):
+    """Exclusive lock so concurrent cold loads build the cache once"""
+    with open(cache_dir + '.lock', 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _cache_dir(csv_path):
+    directory, name = os.path.split(os.path.abspath(csv_path))
+    return os.path.join(directory, '.colcache', os.path.splitext(name)[0])
+
+
+def _fresh_meta(csv_path, cache_dir):
+    """The cached meta if it still describes `csv_path`, else (None, sha256 or None)"""
+    meta_path = os.path.join(cache_dir, 'meta.json')
+    if not os.path.exists(meta_path):
+        return None, None
+    with open(meta_path, encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('version') != CACHE_VERSION:
+        return None, None
+    stat = os.stat(csv_path)
+    if (meta['size'], meta['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+        return meta, None
+    sha256 = _sha256(csv_path)
+    if sha256 != meta['sha256']:
+        return None, sha256
+    # Touched but unchanged: remember the new mtime and keep the cache
+    meta['mtime_ns'] = stat.st_mtime_ns
+    # Readers without the lock may open meta.json at any moment, so never truncate it in place
+    staging = meta_path + f'.{os.getpid()}.tmp'
+    with open(staging, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(staging, meta_path)
+    return meta, None
+
+
+class ColumnTable:
+    """Read-only, memory-mapped columns of one CSV"""
+
+    def __init__(self, cache_dir, meta):
+        self._dir = cache_dir
+        self._meta = meta
+        self._arrays = {}
+        self._lookups = {}
+
+    def __len__(self):
+        return self._meta['rows']
+
+    @property
+    def columns(self):
+        return dict(self._meta['columns'])
+
+    def _load(self, filename):
+        if filename not in self._arrays:
+            self._arrays[filename] = np.load(os.path.join(self._dir, filename), mmap_mode='r')
+        return self._arrays[filename]
+
+    def codes(self, name):
+        """Raw column array: values, or dictionary codes for text columns"""
+        return self._load(f'{name}.npy')
+
+    def vocab(self, name):
+        return self._load(f'{name}.vocab.npy')
+
+    def __getitem__(self, name):
+        if self._meta['columns'][name] == STR:
+            return self.vocab(name)[self.codes(name)]
+        return self.codes(name)
+
+    def code_of(self, name, value):
+        """Dictionary code of `value` in a text column, or -1 if it never occurs"""
+        if name not in self._lookups:
+            self._lookups[name] = {v: i for i, v in enumerate(self.vocab(name).tolist())}
+        return self._lookups[name].get(value, -1)
+
+    def rows_for(self, name, value):
+        """Row positions where column `name` equals `value`"""
+        code = self.code_of(name, value)
+        if code < 0:
+            return np.empty(0, dtype=np.int64)
+        if name in self._meta['indexes']:
+            offsets = self._load(f'{name}.offsets.npy')
+            return self._load(f'{name}.order.npy')[offsets[code]:offsets[code + 1]]
+        return np.flatnonzero(self.codes(name) == code)
+
+
+def load_table(csv_path):
+    """Memory-mapped columns for `csv_path`, building the cache if it is stale"""
+    cache_dir = _cache_dir(csv_path)
+    meta, sha256 = _fresh_meta(csv_path, cache_dir)
+    if meta is None:
+        os.makedirs(os.path.dirname(cache_dir), exist_ok=True)
+        with _build_lock(cache_dir):
+            # Whoever held the lock before us may have built it already
+            meta, sha256 = _fresh_meta(csv_path, cache_dir)
+            if meta is None:
+                meta = _build(csv_path, cache_dir, sha256)
+    return ColumnTable(cache_dir, meta)
+
+
+def load_schema(schema_dir=SCHEMA_DIR, tables=TABLES):
+    return {name: load_table(os.path.join(schema_dir, f'{name}.csv')) for name in tables}
+
+
+if __name__ == '__main__':
+    # Build (or validate) the caches and report cold vs warm load time
+    schema_dir = sys.argv[1] if len(sys.argv) > 1 else SCHEMA_DIR
+    for name in TABLES:
+        path = os.path.join(schema_dir, f'{name}.csv')
+        if not os.path.exists(path):
+            continue
+        start = time.perf_counter()
+        table = load_table(path)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        load_table(path)
+        warm = time.perf_counter() - start
+        print(f'{name:<20} {len(table):>10,} rows  first load {first:.3f}s  warm load {warm * 1000:.2f}ms')
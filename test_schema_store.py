@@ -0,0 +1,42 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from schema_store import STR, load_table
+
+
+class NumericIdTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        self.path = os.path.join(self.folder, 'Appointments.csv')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('patient_id,facility_id,scheduled_date,weight\n'
+                    '001,12,2026-01-05,61.5\n'
+                    '002,12,2026-01-06,\n'
+                    '001,7,2026-01-07,70\n')
+
+    def test_all_digit_ids_are_indexed_text(self):
+        table = load_table(self.path)
+        self.assertEqual(table.columns['patient_id'], STR)
+        self.assertEqual(table.columns['facility_id'], STR)
+        self.assertEqual(table['patient_id'].tolist(), ['001', '002', '001'])
+        self.assertEqual(table.rows_for('patient_id', '001').tolist(), [0, 2])
+        self.assertEqual(table.rows_for('facility_id', '12').tolist(), [0, 1])
+        self.assertEqual(table.rows_for('facility_id', '99').tolist(), [])
+
+    def test_other_numeric_columns_stay_numeric(self):
+        self.assertEqual(load_table(self.path).columns['weight'], 'float')
+
+    def test_touched_csv_keeps_its_cache(self):
+        load_table(self.path)
+        os.utime(self.path, ns=(0, 0))
+        table = load_table(self.path)
+        self.assertEqual(table.rows_for('patient_id', '002').tolist(), [1])
+        cache = os.path.join(self.folder, '.colcache', 'Appointments')
+        self.assertEqual(sorted(name for name in os.listdir(cache) if name.endswith('.tmp')), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+"""Multi-day visit routes for the in-person prospect tours.
+
+Prospects are grouped into stops by district (or by their own `latitude` /
+`longitude` when a record has them, as the Phase 2 facility lists will).
+Distances come from the bundled, offline district coordinates: great-circle
+distance times ROAD_FACTOR, replaced by the known road distance in ROAD_KM
+where there is one. The matrix is computed with numpy and cached on disk
+under the build cache, keyed by the places and coordinates it covers.
+
+The route is a nearest-neighbour tour improved with 2-opt until no reversal
+shortens it; each 2-opt step evaluates every candidate reversal for one edge
+as a numpy vector, so hundreds of stops stay fast. `schedule` then lays the
+route out over working days (driving time plus VISIT_HOURS per prospect).
+
+    route = plan_route(tour_prospects)
+    for stop in schedule(route, first_day=36):
+        print(stop['first_day'], stop['place'], len(stop['prospects']))
+"""
+import hashlib
+import os
+import sys
+import time
+
+import numpy as np
+from build_cache import CACHE_DIR
+
+# Approximate district headquarters coordinates (latitude, longitude)
+DISTRICTS = {
+    'Kampala': (0.3476, 32.5825),
+    'Mbarara': (-0.6072, 30.6545),
+    'Fort Portal': (0.6710, 30.2750),
+    'Kabarole': (0.6710, 30.2750),
+    'Kabale': (-1.2486, 29.9899),
+    'Kisoro': (-1.2854, 29.6850),
+    'Kanungu': (-0.8961, 29.7897),
+    'Rukungiri': (-0.7900, 29.9250),
+    'Ntungamo': (-0.8794, 30.2642),
+    'Bushenyi': (-0.5853, 30.1872),
+    'Sheema': (-0.5750, 30.3800),
+    'Mitooma': (-0.6136, 30.0219),
+    'Rubirizi': (-0.2900, 30.1100),
+    'Buhweju': (-0.3400, 30.3300),
+    'Ibanda': (-0.1339, 30.4950),
+    'Isingiro': (-0.8436, 30.8039),
+    'Kiruhura': (-0.1900, 30.8400),
+    'Kamwenge': (0.1867, 30.4539),
+    'Kasese': (0.1833, 30.0833),
+    'Kyenjojo': (0.6328, 30.6214),
+    'Bundibugyo': (0.7085, 30.0634),
+    'Kagadi': (0.9378, 30.8089),
+    'Kibaale': (0.8000, 31.0667),
+    'Hoima': (1.4331, 31.3524),
+    'Masindi': (1.6744, 31.7150),
+}
+
+# Approximate road distances (km) for the main corridors
+ROAD_KM = {
+    ('Kampala', 'Mbarara'): 266,
+    ('Kampala', 'Fort Portal'): 297,
+    ('Mbarara', 'Kabale'): 140,
+    ('Mbarara', 'Ntungamo'): 66,
+    ('Kabale', 'Kisoro'): 78,
+}
+ROAD_FACTOR = 1.3
+EARTH_RADIUS_KM = 6371.0
+
+DAY_HOURS = 8
+VISIT_HOURS = 4
+AVG_SPEED_KMH = 50
+
+_matrices = {}
+
+
+def place_of(prospect):
+    """(place name, (lat, lon)) for a prospect record"""
+    if 'latitude' in prospect and 'longitude' in prospect:
+        return prospect.get('district') or prospect['name'], (float(prospect['latitude']), float(prospect['longitude']))
+    text = f"{prospect.get('district', '')} {prospect.get('location', '')}".lower()
+    found = [(text.find(name.lower()), name) for name in DISTRICTS if name.lower() in text]
+    if not found:
+        raise KeyError(f"No coordinates for {prospect.get('district') or prospect['name']!r}")
+    name = min(found)[1]
+    return name, DISTRICTS[name]
+
+
+def distance_matrix(places, coordinates):
+    """Road distance estimates (km) between every pair of places"""
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    key = hashlib.sha256(repr((list(places), coordinates.tolist(), sorted(ROAD_KM.items()), ROAD_FACTOR)).encode()).hexdigest()
+    if key in _matrices:
+        return _matrices[key]
+    path = os.path.join(CACHE_DIR, 'distances', f'{key}.npy')
+    if os.path.exists(path):
+        _matrices[key] = np.load(path)
+        return _matrices[key]
+
+    lat, lon = np.radians(coordinates[:, 0]), np.radians(coordinates[:, 1])
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat[:, None]) * np.cos(lat[None, :]) * np.sin(dlon / 2) ** 2
+    matrix = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1))) * ROAD_FACTOR
+    position = {place: i for i, place in enumerate(places)}
+    for (first, second), km in ROAD_KM.items():
+        if first in position and second in position:
+            matrix[position[first], position[second]] = matrix[position[second], position[first]] = km
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.save(path, matrix)
+    _matrices[key] = matrix
+    return matrix
+
+
+def _nearest_neighbour(distances, start):
+    n = len(distances)
+    visited = np.zeros(n, dtype=bool)
+    route = [start]
+    visited[start] = True
+    for _ in range(n - 1):
+        candidates = np.where(visited, np.inf, distances[route[-1]])
+        route.append(int(candidates.argmin()))
+        visited[route[-1]] = True
+    return route
+
+
+def _two_opt(distances, route, fixed_start):
+    """Shorten an open route by segment reversals until none helps
+
+    A zero-distance dummy node closes the path into a cycle, so the free end
+    (and the start, unless it is fixed) can move like any other edge.
+    """
+    n = len(route)
+    padded = np.zeros((n + 1, n + 1))
+    padded[:n, :n] = distances
+    tour = np.array([n, *route])
+    size = n + 1
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1 if fixed_start else 0, size - 2):
+            a, b = tour[i], tour[i + 1]
+            j = np.arange(i + 2, size)
+            c, d = tour[j], tour[(j + 1) % size]
+            delta = padded[a, c] + padded[b, d] - padded[a, b] - padded[c, d]
+            best = int(delta.argmin())
+            if delta[best] < -1e-9:
+                tour[i + 1:j[best] + 1] = tour[i + 1:j[best] + 1][::-1].copy()
+                improved = True
+    # Rotate so the dummy node is first, then drop it
+    zero = int(np.flatnonzero(tour == n)[0])
+    return [int(node) for node in np.roll(tour, -zero)[1:]]
+
+
+def route_length(distances, route):
+    return float(sum(distances[a, b] for a, b in zip(route, route[1:])))
+
+
+def plan_route(prospects, start=None):
+    """Stops in visiting order, each {'place', 'prospects', 'km'}
+
+    `start` is a place name to begin from (e.g. 'Kampala' or 'Mbarara');
+    by default the route starts wherever the shortest path does.
+    """
+    stops = {}
+    for prospect in prospects:
+        place, coordinates = place_of(prospect)
+        stops.setdefault(place, (coordinates, []))[1].append(prospect)
+    if start is not None and start not in stops:
+        stops = {start: (DISTRICTS[start], []), **stops}
+    places = list(stops)
+    distances = distance_matrix(places, [stops[place][0] for place in places])
+
+    if start is not None:
+        first = places.index(start)
+    else:
+        # A path's ends tend to be the outlying stops
+        first = int(distances.sum(axis=1).argmax())
+    route = _two_opt(distances, _nearest_neighbour(distances, first), fixed_start=start is not None)
+
+    result = []
+    for position, node in enumerate(route):
+        km = float(distances[route[position - 1], node]) if position else 0.0
+        result.append({'place': places[node], 'prospects': stops[places[node]][1], 'km': km})
+    return result
+
+
+def schedule(route, first_day=1):
+    """Add 'first_day' and 'last_day' to each stop of a route
+
+    Driving runs at AVG_SPEED_KMH and may spill over into the next day;
+    each prospect needs VISIT_HOURS on site within one DAY_HOURS day.
+    """
+    day, hours = first_day, 0.0
+    for stop in route:
+        hours += stop['km'] / AVG_SPEED_KMH
+        while hours > DAY_HOURS:
+            day, hours = day + 1, hours - DAY_HOURS
+        stop['first_day'] = None
+        for _ in stop['prospects']:
+            if hours + VISIT_HOURS > DAY_HOURS:
+                day, hours = day + 1, 0.0
+            if stop['first_day'] is None:
+                stop['first_day'] = day
+            hours += VISIT_HOURS
+        stop['first_day'] = stop['first_day'] if stop['first_day'] is not None else day
+        stop['last_day'] = day
+    return route
+
+
+def day_range(stop):
+    if stop['first_day'] == stop['last_day']:
+        return f"Day {stop['first_day']}"
+    return f"Day {stop['first_day']}-{stop['last_day']}"
+
+
+if __name__ == '__main__':
+    # Demo: python visit_routes.py [stops] plans a tour over random Western Uganda sites
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    rng = np.random.default_rng(7)
+    sites = [
+        {'name': f'Facility {i}', 'district': f'Site {i}',
+         'latitude': rng.uniform(-1.4, 1.7), 'longitude': rng.uniform(29.6, 31.8)}
+        for i in range(size)
+    ]
+    start = time.perf_counter()
+    route = schedule(plan_route(sites, start='Kampala'), first_day=1)
+    elapsed = time.perf_counter() - start
+    total = sum(stop['km'] for stop in route)
+    print(f"[OK] {size:,} stops, {total:,.0f} km over {route[-1]['last_day']} days, planned in {elapsed:.2f}s")
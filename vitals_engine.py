@@ -0,0 +1,195 @@
+"""Vectorized vitals aggregation over Vitals.csv.
+
+Works on the memory-mapped columns from schema_store, so every step is a
+numpy operation over all readings at once rather than a Python loop:
+
+  - per-patient rolling averages of the last WINDOW readings (heart rate,
+    systolic and diastolic BP), computed from grouped cumulative sums
+  - blood pressure stage per reading and for each patient's latest rolling
+    average (ACC/AHA 2017: Normal, Elevated, Stage 1, Stage 2, Crisis)
+  - BMI from weight (kg) and height (cm)
+  - out-of-range flags per reading, one bit per vital in NORMAL_RANGES
+  - per-facility summaries that the report generators can turn into tables
+
+    summary = summarize_vitals(load_table('HealthFlow-Mobile/schema/Vitals.csv'))
+    table_from_rows(doc, facility_rows(summary, facility_names), style='Light Grid Accent 1')
+
+Vitals.csv has no glucose column, so glucose monitoring is not covered.
+"""
+import os
+import sys
+import time
+
+import numpy as np
+from schema_store import SCHEMA_DIR, STR, load_table
+
+WINDOW = 3
+ROLLING = ('heart_rate', 'blood_pressure_sys', 'blood_pressure_dia')
+
+BP_STAGES = ('Normal', 'Elevated', 'Stage 1', 'Stage 2', 'Crisis')
+
+# Adult resting ranges; readings outside (low, high) are flagged
+NORMAL_RANGES = {
+    'heart_rate': (50, 100),
+    'blood_pressure_sys': (90, 139),
+    'blood_pressure_dia': (60, 89),
+    'temperature': (35.5, 37.9),
+    'respiratory_rate': (12, 20),
+    'oxygen_saturation': (94, 100),
+}
+FLAGS = {name: 1 << bit for bit, name in enumerate(NORMAL_RANGES)}
+
+
+def bp_stage(systolic, diastolic):
+    """Index into BP_STAGES for each reading; -1 where either value is missing"""
+    systolic, diastolic = np.asarray(systolic, dtype=np.float64), np.asarray(diastolic, dtype=np.float64)
+    stage = np.select(
+        [
+            (systolic > 180) | (diastolic > 120),
+            (systolic >= 140) | (diastolic >= 90),
+            (systolic >= 130) | (diastolic >= 80),
+            systolic >= 120,
+        ],
+        [4, 3, 2, 1],
+        default=0,
+    )
+    stage[np.isnan(systolic) | np.isnan(diastolic)] = -1
+    return stage
+
+
+def bmi(weight_kg, height_cm):
+    height_m = np.asarray(height_cm, dtype=np.float64) / 100
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = np.asarray(weight_kg, dtype=np.float64) / (height_m * height_m)
+    value[~np.isfinite(value)] = np.nan
+    return value
+
+
+def out_of_range(columns):
+    """Bitmask per reading of the vitals outside NORMAL_RANGES"""
+    flags = np.zeros(len(next(iter(columns.values()))), dtype=np.uint8)
+    for name, (low, high) in NORMAL_RANGES.items():
+        values = columns[name]
+        flags |= np.where((values < low) | (values > high), FLAGS[name], 0).astype(np.uint8)
+    return flags
+
+
+def rolling_mean(values, group_start, window=WINDOW):
+    """Mean of each reading and the previous window - 1 readings of the same patient
+
+    `values` must be sorted by patient then time; `group_start` holds, for
+    each row, the position of the patient's first reading. Missing values
+    are left out of both the sum and the count.
+    """
+    present = ~np.isnan(values)
+    sums = np.concatenate([[0.0], np.cumsum(np.where(present, values, 0.0))])
+    counts = np.concatenate([[0], np.cumsum(present)])
+    end = np.arange(1, len(values) + 1)
+    start = np.maximum(end - window, group_start)
+    n = counts[end] - counts[start]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(n > 0, (sums[end] - sums[start]) / n, np.nan)
+
+
+def _as_float(value):
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+
+def numeric_column(table, name):
+    """A vital as float64; readings that are blank or not a number are NaN
+
+    schema_store stores a column with any non-numeric cell (or no values at
+    all) as text, so convert its vocabulary once and index it by the codes.
+    """
+    if table.columns[name] != STR:
+        return np.asarray(table[name], dtype=np.float64)
+    vocab = np.array([_as_float(value) for value in table.vocab(name).tolist()], dtype=np.float64)
+    return vocab[table.codes(name)]
+
+
+def summarize_vitals(table, window=WINDOW):
+    """Per-reading, per-patient and per-facility aggregates for a Vitals table"""
+    patient = table.codes('patient_id')
+    order = np.lexsort((table['recorded_at'], patient))
+    patient = patient[order]
+    columns = {name: numeric_column(table, name)[order]
+               for name in (*NORMAL_RANGES, 'weight', 'height')}
+
+    # Row position of each patient's first (and last) reading
+    first = np.flatnonzero(np.r_[True, patient[1:] != patient[:-1]])
+    last = np.r_[first[1:] - 1, len(patient) - 1]
+    group_start = np.repeat(first, np.diff(np.r_[first, len(patient)]))
+
+    rolling = {name: rolling_mean(columns[name], group_start, window) for name in ROLLING}
+    readings = {
+        'order': order,
+        'stage': bp_stage(columns['blood_pressure_sys'], columns['blood_pressure_dia']),
+        'bmi': bmi(columns['weight'], columns['height']),
+        'flags': out_of_range(columns),
+        **{f'{name}_avg': values for name, values in rolling.items()},
+    }
+
+    facility = table.codes('facility_id')[order]
+    patients = {
+        'patient_id': table.vocab('patient_id')[patient[last]],
+        'facility': facility[last],
+        'readings': np.diff(np.r_[first, len(patient)]),
+        'stage': bp_stage(rolling['blood_pressure_sys'][last], rolling['blood_pressure_dia'][last]),
+        'bmi': readings['bmi'][last],
+        'flagged_readings': np.add.reduceat((readings['flags'] != 0).astype(np.int64), first) if len(first) else first,
+        **{f'{name}_avg': values[last] for name, values in rolling.items()},
+    }
+
+    facility_ids = table.vocab('facility_id')
+    n = len(facility_ids)
+    bmi_known = ~np.isnan(patients['bmi'])
+    facilities = {
+        'facility_id': facility_ids,
+        'patients': np.bincount(patients['facility'], minlength=n),
+        'readings': np.bincount(facility, minlength=n),
+        'flagged_readings': np.bincount(facility, weights=readings['flags'] != 0, minlength=n).astype(np.int64),
+        'bmi_sum': np.bincount(patients['facility'][bmi_known], weights=patients['bmi'][bmi_known], minlength=n),
+        'bmi_count': np.bincount(patients['facility'][bmi_known], minlength=n),
+        'stages': np.zeros((n, len(BP_STAGES)), dtype=np.int64),
+    }
+    known = patients['stage'] >= 0
+    np.add.at(facilities['stages'], (patients['facility'][known], patients['stage'][known]), 1)
+    return {'readings': readings, 'patients': patients, 'facilities': facilities}
+
+
+def facility_rows(summary, facility_names=None):
+    """Header and one row per facility, ready for docx_tables.table_from_rows"""
+    facility_names = facility_names or {}
+    f = summary['facilities']
+    rows = [('Facility', 'Patients', 'Readings', 'Flagged', 'Hypertensive (Stage 1+)', 'Crisis', 'Mean BMI')]
+    for i, facility_id in enumerate(f['facility_id'].tolist()):
+        if not f['patients'][i]:
+            continue
+        stages = f['stages'][i]
+        mean_bmi = f'{f["bmi_sum"][i] / f["bmi_count"][i]:.1f}' if f['bmi_count'][i] else '-'
+        rows.append((
+            facility_names.get(facility_id, facility_id),
+            f"{f['patients'][i]:,}",
+            f"{f['readings'][i]:,}",
+            f"{f['flagged_readings'][i] / f['readings'][i]:.1%}",
+            f'{stages[2:].sum() / f["patients"][i]:.1%}',
+            f'{stages[4]:,}',
+            mean_bmi,
+        ))
+    return rows
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(SCHEMA_DIR, 'Vitals.csv')
+    start = time.perf_counter()
+    table = load_table(path)
+    loaded = time.perf_counter() - start
+    summary = summarize_vitals(table)
+    elapsed = time.perf_counter() - start - loaded
+    for row in facility_rows(summary):
+        print(' | '.join(row))
+    print(f'[OK] {len(table):,} readings, {len(summary["patients"]["patient_id"]):,} patients '
+          f'(load {loaded:.2f}s, aggregate {elapsed:.2f}s)')